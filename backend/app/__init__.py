@@ -5,9 +5,12 @@ from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
 from flask_marshmallow import Marshmallow
+from celery import Celery, Task
 import os
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime
 
 # Initialize extensions
@@ -17,6 +20,24 @@ jwt = JWTManager()
 ma = Marshmallow()
 
 
+def _log_in_background(logger):
+    """
+    Move a logger's handlers onto a background thread.
+    
+    The calling thread only enqueues the record; formatting and file/console
+    I/O happen in a QueueListener, so request handlers never block on disk.
+    """
+    # Module-level loggers outlive the app; don't wrap them again on a second create_app()
+    if all(isinstance(h, QueueHandler) for h in logger.handlers):
+        return
+    
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *logger.handlers, respect_handler_level=True)
+    logger.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    atexit.register(listener.stop)
+
+
 def setup_logging(app):
     """Setup comprehensive logging that persists across sessions."""
     # Create logs directory in project root (not backend subdirectory)
@@ -83,6 +104,12 @@ def setup_logging(app):
     api_logger.setLevel(logging.INFO)
     api_logger.addHandler(api_handler)
     
+    # Route loggers use the module-level loggers in app.utils.logging
+    from app.utils.logging import app_logger, user_action_logger
+    
+    for logger in (app.logger, user_logger, api_logger, app_logger, user_action_logger):
+        _log_in_background(logger)
+    
     app.logger.info(f"=" * 80)
     app.logger.info(f"APPLICATION STARTED AT {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     app.logger.info(f"Log files location: {log_dir}")
@@ -92,6 +119,20 @@ def setup_logging(app):
     app.logger.info(f"=" * 80)
 
 
+def celery_init_app(app):
+    """Create the Celery app; tasks run inside a Flask app context."""
+    class FlaskTask(Task):
+        def __call__(self, *args, **kwargs):
+            with app.app_context():
+                return self.run(*args, **kwargs)
+    
+    celery_app = Celery(app.name, task_cls=FlaskTask)
+    celery_app.config_from_object(app.config['CELERY'])
+    celery_app.set_default()
+    app.extensions['celery'] = celery_app
+    return celery_app
+
+
 def create_app(config_name=None):
     """Create and configure the Flask application."""
     app = Flask(__name__)
@@ -103,15 +144,35 @@ def create_app(config_name=None):
     from config import config
     app.config.from_object(config[config_name])
     
+    # bcrypt only accepts work factors 4-31; fail at boot, not on first login
+    if not 4 <= app.config['BCRYPT_ROUNDS'] <= 31:
+        raise ValueError(f"BCRYPT_ROUNDS must be between 4 and 31, got {app.config['BCRYPT_ROUNDS']}")
+    
     # Setup logging FIRST
     setup_logging(app)
     
+    # orjson for API responses and for JSON columns (audit old/new values
+    # carry native datetimes from to_dict())
+    from app.utils.json_provider import ORJSONProvider, dumps as orjson_dumps
+    app.json = ORJSONProvider(app)
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'json_serializer': orjson_dumps,
+        **app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {})
+    }
+    
     # Initialize extensions
     db.init_app(app)
     migrate.init_app(app, db)
     jwt.init_app(app)
     ma.init_app(app)
     CORS(app, origins=app.config['CORS_ORIGINS'])
+    celery_init_app(app)
+    
+    from app.utils.cache import cache_init_app
+    cache_init_app(app)
+    
+    from app.utils.metrics import metrics_init_app
+    metrics_init_app(app, db)
     
     # Create upload directory
     os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
@@ -121,15 +182,14 @@ def create_app(config_name=None):
     def log_request():
         from flask import request
         from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+        from app.utils.permissions import get_token_user
         
-        # Get user info if authenticated
+        # Get user info if authenticated (from the token claims, no users query)
         user_info = "Anonymous"
         try:
             verify_jwt_in_request(optional=True)
-            user_id = get_jwt_identity()
-            if user_id:
-                from app.models import User
-                user = User.query.get(user_id)
+            if get_jwt_identity():
+                user = get_token_user()
                 if user:
                     user_info = f"{user.username} ({user.role})"
         except:
@@ -148,6 +208,27 @@ def create_app(config_name=None):
             except:
                 pass
     
+    @app.after_request
+    def flush_audit_log(response):
+        # Audit entries from requests that never committed (e.g. GET views) are
+        # written by a worker instead of committing on the request thread
+        from app.models.audit_log import AuditLog
+        from app.tasks import write_audit_entries_task
+        entries = AuditLog.take_buffer()
+        if not entries:
+            return response
+        try:
+            write_audit_entries_task.delay(entries)
+        except Exception:
+            app.logger.error("Audit queue unavailable, writing entries inline", exc_info=True)
+            try:
+                AuditLog.write_entries(entries)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                app.logger.error("Failed to write buffered audit log entries", exc_info=True)
+        return response
+    
     @app.after_request
     def log_response(response):
         from flask import request
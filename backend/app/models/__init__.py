@@ -24,7 +24,7 @@ from app.models.patient_safety_alerts import (
     create_safety_alert_from_adr
 )
 from app.models.wound import WoundAssessment
-# from app.models.specialty_assessment import SpecialtyAssessment  # Commented out due to syntax errors
+from app.models.specialty_assessment import SpecialtyAssessment
 from app.models.audit_log import AuditLog
 from app.models.care_plan import (
     CarePlan,
@@ -61,7 +61,7 @@ __all__ = [
     'Assessment',
     'VitalSigns',
     'WoundAssessment',
-    # 'SpecialtyAssessment',  # Commented out due to syntax errors
+    'SpecialtyAssessment',
     'AuditLog',
     'CarePlan',
     'NursingIntervention',
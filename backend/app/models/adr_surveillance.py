@@ -6,7 +6,9 @@ to detect potential adverse drug reactions and medication-related problems.
 """
 from datetime import datetime, timedelta
 from app import db
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy import DDL, FetchedValue, bindparam, cast, event, func, select, update
+from sqlalchemy.dialects.postgresql import JSON, JSONB
+from sqlalchemy.orm import Session
 
 
 class MedicationAdverseReaction(db.Model):
@@ -119,6 +121,11 @@ class PatientObservation(db.Model):
     with known ADRs for patient's current medications.
     """
     __tablename__ = 'patient_observations'
+    __table_args__ = (
+        db.Index('ix_observations_patient_obsdt', 'patient_id', db.text('observation_datetime DESC')),
+        db.Index('ix_observations_obsdt_brin', 'observation_datetime',
+                 postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+    )
     
     # Observation type constants
     TYPE_SYMPTOM = 'SYMPTOM'  # Patient complaint or observed symptom
@@ -175,8 +182,8 @@ class PatientObservation(db.Model):
     def __repr__(self):
         return f'<PatientObservation {self.id}: {self.observation_type} for Patient {self.patient_id}>'
     
-    def to_dict(self, include_alerts=False):
-        """Serialize to dictionary."""
+    def to_dict(self, include_alerts=False, alerts=None):
+        """Serialize to dictionary (pass preloaded alerts to skip the per-row query)."""
         data = {
             'id': self.id,
             'patient_id': self.patient_id,
@@ -186,13 +193,15 @@ class PatientObservation(db.Model):
             'standardized_terms': self.standardized_terms,
             'severity_rating': self.severity_rating,
             'patient_reported': self.patient_reported,
-            'observation_datetime': self.observation_datetime.isoformat(),
+            'observation_datetime': self.observation_datetime,
             'potential_adr_detected': self.potential_adr_detected,
-            'created_at': self.created_at.isoformat()
+            'created_at': self.created_at
         }
         
         if include_alerts:
-            data['adr_alerts'] = [alert.to_dict() for alert in self.adr_alerts.all()]
+            if alerts is None:
+                alerts = self.adr_alerts.all()
+            data['adr_alerts'] = [alert.to_dict() for alert in alerts]
         
         return data
 
@@ -205,6 +214,12 @@ class ADRAlert(db.Model):
     and known adverse reactions for current medications.
     """
     __tablename__ = 'adr_alerts'
+    __table_args__ = (
+        db.Index('ix_adr_alerts_fac_created_status', 'facility_id', db.text('created_at DESC'), 'status'),
+        db.Index('ix_adr_alerts_fac_urgency', 'facility_id', 'urgency_rank', db.text('created_at DESC')),
+        db.Index('ix_adr_alerts_created_brin', 'created_at',
+                 postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+    )
     
     # Alert status constants
     STATUS_NEW = 'NEW'  # Newly generated, not yet reviewed
@@ -239,10 +254,11 @@ class ADRAlert(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     patient_id = db.Column(db.Integer, db.ForeignKey('patients.id'), nullable=False, index=True)
     facility_id = db.Column(db.Integer, db.ForeignKey('facilities.id'), nullable=False, index=True)
+    patient_name = db.Column(db.String(201), server_default=FetchedValue())  # Denormalized by DB trigger for dashboards
     
     # Related records
     medication_id = db.Column(db.Integer, db.ForeignKey('medications.id'), nullable=False, index=True)
-    observation_id = db.Column(db.Integer, db.ForeignKey('patient_observations.id'), nullable=False)
+    observation_id = db.Column(db.Integer, db.ForeignKey('patient_observations.id'), nullable=False, index=True)
     known_adr_id = db.Column(db.Integer, db.ForeignKey('medication_adverse_reactions.id'), nullable=False)
     
     # Alert details
@@ -269,6 +285,11 @@ class ADRAlert(db.Model):
     nursing_interventions = db.Column(JSON, default=[])  # Actions within nursing scope
     provider_notification_needed = db.Column(db.Boolean, default=True)  # Does provider need to be notified?
     provider_notification_urgency = db.Column(db.String(20))  # 'ROUTINE', 'URGENT', 'STAT'
+    urgency_rank = db.Column(db.SmallInteger, db.Computed(
+        "CASE provider_notification_urgency "
+        "WHEN 'STAT' THEN 1 WHEN 'URGENT' THEN 2 WHEN 'ROUTINE' THEN 3 ELSE 4 END",
+        persisted=True
+    ))  # Sort key for dashboards (1 = most urgent)
     provider_notification_guidance = db.Column(db.Text)  # What to tell provider
     suggested_provider_orders = db.Column(JSON, default=[])  # What provider may want to order
     requires_immediate_action = db.Column(db.Boolean, default=False)  # STAT notification needed
@@ -284,7 +305,8 @@ class ADRAlert(db.Model):
     acknowledged_at = db.Column(db.DateTime)
     
     # Investigation outcome
-    investigation_notes = db.Column(db.Text)
+    investigation_notes = db.Column(JSONB, default=list)  # [{ts, user_id, ...}] appended in SQL
+    cached_repr = db.Column(JSONB)  # to_dict() snapshot for dashboards; cleared by DB trigger on update
     action_taken = db.Column(db.Text)
     outcome = db.Column(db.Text)
     
@@ -337,11 +359,45 @@ class ADRAlert(db.Model):
         delta = self.resolved_at - self.created_at
         return round(delta.total_seconds() / 3600, 1)
     
+    @staticmethod
+    def investigation_note_appended(**entry):
+        """SQL expression for investigation_notes with one entry appended (JSONB ||)."""
+        entry = {'ts': datetime.utcnow(), **entry}
+        return func.coalesce(
+            ADRAlert.investigation_notes, cast([], JSONB)
+        ).op('||')(cast([entry], JSONB))
+    
+    @staticmethod
+    def append_investigation_note(alert_id, **entry):
+        """
+        Append an entry to investigation_notes in SQL.
+        
+        The existing notes are never read into Python or rewritten wholesale.
+        """
+        db.session.execute(
+            update(ADRAlert)
+            .where(ADRAlert.id == alert_id)
+            .values(investigation_notes=ADRAlert.investigation_note_appended(**entry))
+        )
+        ADRAlert.snapshot_on_commit(db.session, alert_id)
+    
+    @staticmethod
+    def snapshot_on_commit(session, *alert_ids):
+        """
+        Store to_dict() in cached_repr for these alerts when the session commits.
+        
+        ORM writes are queued automatically; callers issuing Core UPDATEs on
+        adr_alerts queue the ids themselves.
+        """
+        if alert_ids:
+            session.info.setdefault('adr_alert_snapshots', set()).update(alert_ids)
+    
     def to_dict(self, include_suggestions=True):
         """Serialize to dictionary."""
         data = {
             'id': self.id,
             'patient_id': self.patient_id,
+            'patient_name': self.patient_name,
             'medication_id': self.medication_id,
             'observation_id': self.observation_id,
             'suspected_reaction': self.suspected_reaction,
@@ -362,9 +418,9 @@ class ADRAlert(db.Model):
             'resolution_time_hours': self.resolution_time_hours,
             'pharmacist_consulted': self.pharmacist_consulted,
             'provider_notified': self.provider_notified,
-            'created_at': self.created_at.isoformat(),
-            'acknowledged_at': self.acknowledged_at.isoformat() if self.acknowledged_at else None,
-            'resolved_at': self.resolved_at.isoformat() if self.resolved_at else None
+            'created_at': self.created_at,
+            'acknowledged_at': self.acknowledged_at,
+            'resolved_at': self.resolved_at
         }
         
         if include_suggestions:
@@ -389,6 +445,9 @@ class ADRAlertAcknowledgment(db.Model):
     after each shift (12 hours) requiring re-acknowledgment.
     """
     __tablename__ = 'adr_alert_acknowledgments'
+    __table_args__ = (
+        db.Index('ix_ack_alert_user_ackat', 'alert_id', 'user_id', db.text('acknowledged_at DESC')),
+    )
     
     # Action constants
     ACTION_ACKNOWLEDGED = 'ACKNOWLEDGED'  # Aware and monitoring
@@ -457,8 +516,8 @@ class ADRAlertAcknowledgment(db.Model):
             'alert_id': self.alert_id,
             'user_id': self.user_id,
             'action_taken': self.action_taken,
-            'acknowledged_at': self.acknowledged_at.isoformat(),
-            'expires_at': self.expires_at.isoformat(),
+            'acknowledged_at': self.acknowledged_at,
+            'expires_at': self.expires_at,
             'is_expired': self.is_expired,
             'is_valid': self.is_valid,
             'verified_reaction_awareness': self.verified_reaction_awareness,
@@ -467,11 +526,11 @@ class ADRAlertAcknowledgment(db.Model):
             'hold_reason': self.hold_reason,
             'hold_duration': self.hold_duration,
             'provider_notified': self.provider_notified,
-            'provider_notified_at': self.provider_notified_at.isoformat() if self.provider_notified_at else None,
+            'provider_notified_at': self.provider_notified_at,
             'hold_order_obtained': self.hold_order_obtained,
             'notes': self.notes,
             'monitoring_plan': self.monitoring_plan,
-            'created_at': self.created_at.isoformat()
+            'created_at': self.created_at
         }
 
 
@@ -503,3 +562,99 @@ class ADRSurveillanceLog(db.Model):
     
     def __repr__(self):
         return f'<ADRSurveillanceLog {self.id}: {self.alerts_generated} alerts from {self.observations_analyzed} observations>'
+
+
+
+@event.listens_for(Session, 'after_flush')
+def _invalidate_active_alerts_cache(session, flush_context):
+    """Retire cached active-alert sets for patients whose alerts changed."""
+    from app.utils.cache import active_alerts_key, bump_on_commit
+    bump_on_commit(session, *(
+        active_alerts_key(obj.facility_id, obj.patient_id)
+        for obj in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(obj, ADRAlert)
+    ))
+
+
+@event.listens_for(Session, 'after_flush')
+def _queue_alert_snapshots(session, flush_context):
+    """Rebuild dashboard snapshots at commit for alerts the flush wrote."""
+    ADRAlert.snapshot_on_commit(session, *(
+        obj.id for obj in (*session.new, *session.dirty)
+        if isinstance(obj, ADRAlert) and session.is_modified(obj)
+    ))
+
+
+@event.listens_for(Session, 'before_commit')
+def _write_alert_snapshots(session):
+    """Store cached_repr for queued alerts in the same transaction as the write."""
+    if not session.info.get('adr_alert_snapshots') and not session.new and not session.dirty:
+        return
+    
+    session.flush()  # queues ids for alert changes still pending
+    alert_ids = session.info.pop('adr_alert_snapshots', None)
+    if not alert_ids:
+        return
+    
+    # Re-read so trigger/computed columns (patient_name, urgency_rank) are current
+    alerts = session.scalars(
+        select(ADRAlert).where(ADRAlert.id.in_(alert_ids))
+        .execution_options(populate_existing=True)
+    ).all()
+    if not alerts:
+        return
+    
+    # Only fill cleared snapshots (the trigger nulls cached_repr on every other
+    # update), and pin updated_at so storing a snapshot is not a modification
+    table = ADRAlert.__table__
+    session.execute(
+        update(table)
+        .where(table.c.id == bindparam('alert_id'), table.c.cached_repr.is_(None))
+        .values(cached_repr=bindparam('snapshot'), updated_at=table.c.updated_at),
+        [{'alert_id': alert.id, 'snapshot': alert.to_dict()} for alert in alerts]
+    )
+
+# Keep ADRAlert.patient_name in sync with patients (create_all path; see migrations)
+event.listen(ADRAlert.__table__, 'after_create', DDL("""
+CREATE OR REPLACE FUNCTION adr_alerts_set_patient_name() RETURNS trigger AS $$
+BEGIN
+    SELECT first_name || ' ' || last_name INTO NEW.patient_name
+    FROM patients WHERE id = NEW.patient_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER adr_alerts_set_patient_name
+    BEFORE INSERT OR UPDATE OF patient_id ON adr_alerts
+    FOR EACH ROW EXECUTE FUNCTION adr_alerts_set_patient_name();
+
+CREATE OR REPLACE FUNCTION patients_sync_adr_alert_name() RETURNS trigger AS $$
+BEGIN
+    UPDATE adr_alerts SET patient_name = NEW.first_name || ' ' || NEW.last_name
+    WHERE patient_id = NEW.id AND resolved_at IS NULL;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER patients_sync_adr_alert_name
+    AFTER UPDATE OF first_name, last_name ON patients
+    FOR EACH ROW EXECUTE FUNCTION patients_sync_adr_alert_name();
+"""))
+
+
+# Invalidate ADRAlert.cached_repr on any update that does not itself set it
+# (create_all path; see migrations)
+event.listen(ADRAlert.__table__, 'after_create', DDL("""
+CREATE OR REPLACE FUNCTION adr_alerts_clear_cached_repr() RETURNS trigger AS $$
+BEGIN
+    IF NEW.cached_repr IS NOT DISTINCT FROM OLD.cached_repr THEN
+        NEW.cached_repr := NULL;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER adr_alerts_clear_cached_repr
+    BEFORE UPDATE ON adr_alerts
+    FOR EACH ROW EXECUTE FUNCTION adr_alerts_clear_cached_repr();
+"""))
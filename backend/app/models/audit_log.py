@@ -1,5 +1,8 @@
 """Audit log model for HIPAA compliance."""
 from datetime import datetime
+from flask import g, has_request_context
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
 from app import db
 
 
@@ -81,8 +84,10 @@ class AuditLog(db.Model):
             new_values: Dict of new values (for updates)
             request: Flask request object
             phi_accessed: Whether PHI was accessed
+        
+        The entry is written with the request's next commit.
         """
-        log = AuditLog(
+        values = dict(
             user_id=user.id if user else None,
             username=user.username if user else 'system',
             user_role=user.role if user else 'system',
@@ -94,19 +99,45 @@ class AuditLog(db.Model):
             old_values=old_values,
             new_values=new_values,
             phi_accessed=phi_accessed,
-            status='success'
+            status='success',
+            timestamp=datetime.utcnow()
         )
         
         if request:
-            log.ip_address = request.remote_addr
-            log.user_agent = request.headers.get('User-Agent', '')
-            log.endpoint = request.endpoint
-            log.http_method = request.method
-        
-        db.session.add(log)
-        db.session.commit()
+            values['ip_address'] = request.remote_addr
+            values['user_agent'] = request.headers.get('User-Agent', '')
+            values['endpoint'] = request.endpoint
+            values['http_method'] = request.method
         
-        return log
+        # Inside a request, entries are buffered and written as one multi-row
+        # INSERT with the request's own commit (or after the response if the
+        # request never commits). Outside a request, write immediately.
+        if has_request_context():
+            g.setdefault('audit_buffer', []).append(values)
+        else:
+            db.session.execute(insert(AuditLog), [values])
+            db.session.commit()
+    
+    @staticmethod
+    def take_buffer():
+        """Remove and return the audit entries buffered during this request."""
+        if not has_request_context():
+            return []
+        return g.pop('audit_buffer', None) or []
+    
+    @staticmethod
+    def write_entries(rows, session=None):
+        """Insert audit entry dicts as one multi-row INSERT (caller commits)."""
+        (session or db.session).execute(insert(AuditLog), rows)
+    
+    @staticmethod
+    def flush_buffer(session=None):
+        """Insert any audit entries buffered during this request. Returns True if any were written."""
+        rows = AuditLog.take_buffer()
+        if not rows:
+            return False
+        AuditLog.write_entries(rows, session)
+        return True
     
     @staticmethod
     def log_access(user_id, action, resource_type, resource_id=None, 
@@ -129,3 +160,9 @@ class AuditLog(db.Model):
     
     def __repr__(self):
         return f'<AuditLog {self.id}: {self.username} {self.action} {self.resource_type}>'
+
+
+@event.listens_for(Session, 'before_commit')
+def _flush_audit_buffer(session):
+    """Write buffered audit entries in the same transaction as the request's commit."""
+    AuditLog.flush_buffer(session)
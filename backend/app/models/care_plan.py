@@ -2,13 +2,18 @@
 from datetime import datetime, timedelta
 from app import db
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy import Text
+from sqlalchemy import Text, event, inspect
+from sqlalchemy.orm import Session
 
 
 class CarePlan(db.Model):
     """Master care plan for a patient - contains goals and overall plan of care."""
     
     __tablename__ = 'care_plans'
+    __table_args__ = (
+        db.Index('ix_care_plans_fac_created', 'facility_id', db.text('created_at DESC')),
+        db.Index('ix_care_plans_patient_created', 'patient_id', db.text('created_at DESC')),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     patient_id = db.Column(db.Integer, db.ForeignKey('patients.id'), nullable=False, index=True)
@@ -48,9 +53,10 @@ class CarePlan(db.Model):
     
     # Relationships
     patient = db.relationship('Patient', backref='care_plans')
-    nursing_interventions = db.relationship('NursingIntervention', backref='care_plan', lazy='dynamic', cascade='all, delete-orphan')
-    physician_orders = db.relationship('PhysicianOrder', backref='care_plan', lazy='dynamic', cascade='all, delete-orphan')
-    assistance_tasks = db.relationship('AssistanceTask', backref='care_plan', lazy='dynamic', cascade='all, delete-orphan')
+    # Plain collections (not dynamic) so the detail view can selectinload them
+    nursing_interventions = db.relationship('NursingIntervention', back_populates='care_plan', cascade='all, delete-orphan')
+    physician_orders = db.relationship('PhysicianOrder', back_populates='care_plan', cascade='all, delete-orphan')
+    assistance_tasks = db.relationship('AssistanceTask', back_populates='care_plan', cascade='all, delete-orphan')
     
     def to_dict(self):
         """Convert to dictionary for API responses."""
@@ -62,19 +68,19 @@ class CarePlan(db.Model):
             'plan_type': self.plan_type,
             'primary_diagnosis': self.primary_diagnosis,
             'care_goals': self.care_goals,
-            'start_date': self.start_date.isoformat() if self.start_date else None,
-            'target_end_date': self.target_end_date.isoformat() if self.target_end_date else None,
-            'actual_end_date': self.actual_end_date.isoformat() if self.actual_end_date else None,
-            'last_reviewed_date': self.last_reviewed_date.isoformat() if self.last_reviewed_date else None,
-            'next_review_date': self.next_review_date.isoformat() if self.next_review_date else None,
+            'start_date': self.start_date,
+            'target_end_date': self.target_end_date,
+            'actual_end_date': self.actual_end_date,
+            'last_reviewed_date': self.last_reviewed_date,
+            'next_review_date': self.next_review_date,
             'status': self.status,
             'primary_nurse_id': self.primary_nurse_id,
             'physician_name': self.physician_name,
             'physician_phone': self.physician_phone,
             'clinical_summary': self.clinical_summary,
             'discharge_plan': self.discharge_plan,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
         }
 
 
@@ -144,6 +150,7 @@ class NursingIntervention(db.Model):
     discontinued_reason = db.Column(db.Text)
     
     # Relationships
+    care_plan = db.relationship('CarePlan', back_populates='nursing_interventions')
     patient = db.relationship('Patient', backref='nursing_interventions')
     completions = db.relationship('InterventionCompletion', backref='intervention', lazy='dynamic', cascade='all, delete-orphan')
     
@@ -160,8 +167,8 @@ class NursingIntervention(db.Model):
             'frequency_times_per_day': self.frequency_times_per_day,
             'scheduled_times': self.scheduled_times,
             'prn_indication': self.prn_indication,
-            'start_date': self.start_date.isoformat() if self.start_date else None,
-            'end_date': self.end_date.isoformat() if self.end_date else None,
+            'start_date': self.start_date,
+            'end_date': self.end_date,
             'assigned_role': self.assigned_role,
             'assigned_user_id': self.assigned_user_id,
             'requires_rn': self.requires_rn,
@@ -170,8 +177,8 @@ class NursingIntervention(db.Model):
             'priority': self.priority,
             'requires_documentation': self.requires_documentation,
             'expected_outcome': self.expected_outcome,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
         }
 
 
@@ -233,6 +240,7 @@ class PhysicianOrder(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
+    care_plan = db.relationship('CarePlan', back_populates='physician_orders')
     patient = db.relationship('Patient', backref='physician_orders')
     completions = db.relationship('OrderCompletion', backref='order', lazy='dynamic', cascade='all, delete-orphan')
     
@@ -247,21 +255,21 @@ class PhysicianOrder(db.Model):
             'ordering_physician': self.ordering_physician,
             'physician_npi': self.physician_npi,
             'physician_phone': self.physician_phone,
-            'order_date': self.order_date.isoformat() if self.order_date else None,
-            'start_date': self.start_date.isoformat() if self.start_date else None,
-            'end_date': self.end_date.isoformat() if self.end_date else None,
+            'order_date': self.order_date,
+            'start_date': self.start_date,
+            'end_date': self.end_date,
             'frequency': self.frequency,
             'duration': self.duration,
             'prn_indication': self.prn_indication,
             'status': self.status,
             'verification_status': self.verification_status,
             'verified_by_user_id': self.verified_by_user_id,
-            'verified_at': self.verified_at.isoformat() if self.verified_at else None,
+            'verified_at': self.verified_at,
             'assigned_to_user_id': self.assigned_to_user_id,
             'priority': self.priority,
             'special_instructions': self.special_instructions,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
         }
 
 
@@ -324,6 +332,7 @@ class AssistanceTask(db.Model):
     discontinued_reason = db.Column(db.Text)
     
     # Relationships
+    care_plan = db.relationship('CarePlan', back_populates='assistance_tasks')
     patient = db.relationship('Patient', backref='assistance_tasks')
     completions = db.relationship('TaskCompletion', backref='task', lazy='dynamic', cascade='all, delete-orphan')
     
@@ -341,8 +350,8 @@ class AssistanceTask(db.Model):
             'frequency_times_per_day': self.frequency_times_per_day,
             'scheduled_times': self.scheduled_times,
             'estimated_duration_minutes': self.estimated_duration_minutes,
-            'start_date': self.start_date.isoformat() if self.start_date else None,
-            'end_date': self.end_date.isoformat() if self.end_date else None,
+            'start_date': self.start_date,
+            'end_date': self.end_date,
             'assigned_role': self.assigned_role,
             'assigned_user_id': self.assigned_user_id,
             'requires_two_person_assist': self.requires_two_person_assist,
@@ -353,8 +362,8 @@ class AssistanceTask(db.Model):
             'fall_risk_precautions': self.fall_risk_precautions,
             'patient_preferences': self.patient_preferences,
             'requires_documentation': self.requires_documentation,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
         }
 
 
@@ -362,6 +371,9 @@ class InterventionCompletion(db.Model):
     """Documentation of completed nursing interventions."""
     
     __tablename__ = 'intervention_completions'
+    __table_args__ = (
+        db.Index('ix_intervention_completions_int_completed', 'intervention_id', db.text('completed_at DESC')),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     intervention_id = db.Column(db.Integer, db.ForeignKey('nursing_interventions.id'), nullable=False, index=True)
@@ -399,7 +411,7 @@ class InterventionCompletion(db.Model):
             'id': self.id,
             'intervention_id': self.intervention_id,
             'patient_id': self.patient_id,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'completed_at': self.completed_at,
             'completed_by_user_id': self.completed_by_user_id,
             'status': self.status,
             'completion_notes': self.completion_notes,
@@ -410,7 +422,7 @@ class InterventionCompletion(db.Model):
             'duration_minutes': self.duration_minutes,
             'requires_follow_up': self.requires_follow_up,
             'follow_up_notes': self.follow_up_notes,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'created_at': self.created_at,
         }
 
 
@@ -452,7 +464,7 @@ class OrderCompletion(db.Model):
             'id': self.id,
             'order_id': self.order_id,
             'patient_id': self.patient_id,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'completed_at': self.completed_at,
             'completed_by_user_id': self.completed_by_user_id,
             'status': self.status,
             'completion_notes': self.completion_notes,
@@ -461,7 +473,7 @@ class OrderCompletion(db.Model):
             'requires_follow_up': self.requires_follow_up,
             'follow_up_notes': self.follow_up_notes,
             'physician_notified': self.physician_notified,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'created_at': self.created_at,
         }
 
 
@@ -469,6 +481,9 @@ class TaskCompletion(db.Model):
     """Documentation of completed assistance tasks (ADLs, etc.)."""
     
     __tablename__ = 'task_completions'
+    __table_args__ = (
+        db.Index('ix_task_completions_task_completed', 'task_id', db.text('completed_at DESC')),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     task_id = db.Column(db.Integer, db.ForeignKey('assistance_tasks.id'), nullable=False, index=True)
@@ -508,7 +523,7 @@ class TaskCompletion(db.Model):
             'id': self.id,
             'task_id': self.task_id,
             'patient_id': self.patient_id,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'completed_at': self.completed_at,
             'completed_by_user_id': self.completed_by_user_id,
             'assisted_by_user_id': self.assisted_by_user_id,
             'status': self.status,
@@ -519,5 +534,23 @@ class TaskCompletion(db.Model):
             'incident_notes': self.incident_notes,
             'reason_not_done': self.reason_not_done,
             'duration_minutes': self.duration_minutes,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'created_at': self.created_at,
         }
+
+
+@event.listens_for(Session, 'after_flush')
+def _invalidate_care_plans_cache(session, flush_context):
+    """Retire cached care plan pages for the facility/patient/status views that changed."""
+    from app.utils.cache import bump_on_commit, care_plan_owner_key, care_plans_key, invalidate_on_commit
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, CarePlan):
+            # Owners never change (and misses aren't cached); only a delete matters
+            if obj in session.deleted:
+                invalidate_on_commit(session, care_plan_owner_key(obj.id))
+            # A status change moves the plan out of the old status's view too
+            statuses = {None, obj.status, *inspect(obj).attrs.status.history.deleted}
+            bump_on_commit(session, *(
+                care_plans_key(obj.facility_id, patient_id, status)
+                for patient_id in (None, obj.patient_id)
+                for status in statuses
+            ))
@@ -1,5 +1,7 @@
 """Medication models for prescriptions and administration records."""
 from datetime import datetime
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 from app import db
 
 
@@ -192,3 +194,14 @@ class MedicationAdministration(db.Model):
     
     def __repr__(self):
         return f'<MedicationAdministration {self.id}: {self.status} at {self.actual_time}>'
+
+
+@event.listens_for(Session, 'after_flush')
+def _invalidate_active_meds_cache(session, flush_context):
+    """Retire cached active-medication snapshots for patients whose meds changed."""
+    from app.utils.cache import active_meds_key, bump_on_commit
+    bump_on_commit(session, *(
+        active_meds_key(obj.patient_id)
+        for obj in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(obj, Medication)
+    ))
@@ -99,8 +99,8 @@ class Patient(db.Model):
                                  cascade='all, delete-orphan')
     wounds = db.relationship('WoundAssessment', back_populates='patient', lazy='dynamic',
                             cascade='all, delete-orphan')
-    # specialty_assessments = db.relationship('SpecialtyAssessment', back_populates='patient', 
-    #                                        lazy='dynamic', cascade='all, delete-orphan')
+    specialty_assessments = db.relationship('SpecialtyAssessment', back_populates='patient',
+                                           lazy='dynamic', cascade='all, delete-orphan')
     
     @property
     def age(self):
@@ -1,5 +1,8 @@
 """Systems-based assessment model for comprehensive clinical documentation."""
+from bisect import bisect_right
+from dataclasses import dataclass
 from datetime import datetime
+from functools import singledispatch
 from app import db
 import json
 
@@ -170,9 +173,6 @@ class IntegumentaryAssessments:
 # RESPIRATORY SYSTEM ASSESSMENTS
 # =============================================================================
 
-class RespiratoryAssessments:
-
-
 class RespiratoryAssessments:
     """Assessment tools for respiratory conditions and breathing function."""
     
@@ -421,6 +421,18 @@ class NeurologicalAssessments:
 # GASTROINTESTINAL SYSTEM ASSESSMENTS
 # =============================================================================
 
+# Dysphagia screening items (input key, concern label); tuple index is the bit position
+_SWALLOW_CONCERNS = (
+    ('coughing_during_meals', 'coughing_choking'),
+    ('wet_voice_after_swallow', 'wet_voice'),
+    ('pocketing_food', 'pocketing'),
+    ('prolonged_meal_time', 'slow_eating'),
+    ('difficulty_specific_textures', 'texture_difficulty'),
+    ('weight_loss', 'weight_loss'),
+    ('recurrent_pneumonia', 'aspiration_risk'),
+)
+
+
 class GastrointestinalAssessments:
     """Assessment tools for nutrition, digestion, and GI function."""
     
@@ -494,30 +506,21 @@ class GastrointestinalAssessments:
         """
         Dysphagia screening.
         """
-        concerns = []
-        
-        if data.get('coughing_during_meals', False):
-            concerns.append('coughing_choking')
-        if data.get('wet_voice_after_swallow', False):
-            concerns.append('wet_voice')
-        if data.get('pocketing_food', False):
-            concerns.append('pocketing')
-        if data.get('prolonged_meal_time', False):
-            concerns.append('slow_eating')
-        if data.get('difficulty_specific_textures', False):
-            concerns.append('texture_difficulty')
-        if data.get('weight_loss', False):
-            concerns.append('weight_loss')
-        if data.get('recurrent_pneumonia', False):
-            concerns.append('aspiration_risk')
-        
-        if len(concerns) >= 3:
+        mask = 0
+        for bit, (key, _) in enumerate(_SWALLOW_CONCERNS):
+            if data.get(key, False):
+                mask |= 1 << bit
+        count = mask.bit_count()
+        
+        if count >= 3:
             risk = 'high'
-        elif len(concerns) >= 1:
+        elif count >= 1:
             risk = 'moderate'
         else:
             risk = 'low'
         
+        concerns = [label for bit, (_, label) in enumerate(_SWALLOW_CONCERNS) if mask >> bit & 1]
+        
         return concerns, risk
 
 
@@ -551,11 +554,40 @@ class GenitourinaryAssessments:
 # MUSCULOSKELETAL SYSTEM ASSESSMENTS
 # =============================================================================
 
-class MusculoskeletalAssessments:
-    """Assessment tools for mobility, fall risk, and musculoskeletal function."""
-    
-    @staticmethod
-    def morse_fall_scale(data):
+# Barthel Index items (equally weighted) and dependency bands: a total at or
+# above _BARTHEL_CUTOFFS[i] moves up to _BARTHEL_LEVELS[i + 1]
+_BARTHEL_ITEMS = (
+    'feeding', 'bathing', 'grooming', 'dressing', 'bowel_control',
+    'bladder_control', 'toilet_use', 'transfers', 'mobility', 'stairs'
+)
+_BARTHEL_CUTOFFS = (20, 40, 60, 80)
+_BARTHEL_LEVELS = (
+    'totally_dependent',
+    'very_dependent',
+    'partially_dependent',
+    'minimally_dependent',
+    'independent',
+)
+
+
+@dataclass(slots=True)
+class BarthelInput:
+    """Barthel Index item scores, built once at the request boundary."""
+    feeding: int = 0
+    bathing: int = 0
+    grooming: int = 0
+    dressing: int = 0
+    bowel_control: int = 0
+    bladder_control: int = 0
+    toilet_use: int = 0
+    transfers: int = 0
+    mobility: int = 0
+    stairs: int = 0
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Build from a request payload, ignoring non-Barthel keys."""
+        return cls(**{item: data[item] for item in _BARTHEL_ITEMS if item in data})
 
 
 class MusculoskeletalAssessments:
@@ -635,38 +667,43 @@ class MusculoskeletalAssessments:
         Scores: feeding, bathing, grooming, dressing, bowels, bladder,
                 toilet use, transfers, mobility, stairs
         Total: 0-100 (higher = more independent)
-        """
-        total = sum([
-            data.get('feeding', 0),
-            data.get('bathing', 0),
-            data.get('grooming', 0),
-            data.get('dressing', 0),
-            data.get('bowel_control', 0),
-            data.get('bladder_control', 0),
-            data.get('toilet_use', 0),
-            data.get('transfers', 0),
-            data.get('mobility', 0),
-            data.get('stairs', 0)
-        ])
         
-        if total >= 80:
-            dependency = 'independent'
-        elif total >= 60:
-            dependency = 'minimally_dependent'
-        elif total >= 40:
-            dependency = 'partially_dependent'
-        elif total >= 20:
-            dependency = 'very_dependent'
-        else:
-            dependency = 'totally_dependent'
+        data: BarthelInput, or a dict of item scores
+        """
+        return MusculoskeletalAssessments.barthel_index_batch([data])[0]
+    
+    @staticmethod
+    def barthel_index_batch(rows):
+        """
+        Score a cohort of Barthel Index assessments in one pass.
         
-        return total, dependency
+        rows: iterable of BarthelInput (or dicts with the same keys).
+        Returns a list of (total, dependency) tuples in input order.
+        """
+        results = []
+        for inp in rows:
+            if not isinstance(inp, BarthelInput):
+                inp = BarthelInput.from_dict(inp)
+            total = (inp.feeding + inp.bathing + inp.grooming + inp.dressing
+                     + inp.bowel_control + inp.bladder_control + inp.toilet_use
+                     + inp.transfers + inp.mobility + inp.stairs)
+            results.append((total, _BARTHEL_LEVELS[bisect_right(_BARTHEL_CUTOFFS, total)]))
+        return results
 
 
 # =============================================================================
 # ENDOCRINE SYSTEM ASSESSMENTS
 # =============================================================================
 
+# Diabetic foot risk factor labels; tuple index is the bit position
+_FOOT_RISK_FACTORS = (
+    'neuropathy',
+    'peripheral_vascular_disease',
+    'active_wound',
+    'structural_deformity',
+)
+
+
 class EndocrineAssessments:
     """Assessment tools for diabetes, thyroid, and metabolic conditions."""
     
@@ -684,23 +721,23 @@ class EndocrineAssessments:
             'footwear': data.get('appropriate_footwear', True)
         }
         
-        risk_factors = []
-        if findings['sensation'] == 'diminished':
-            risk_factors.append('neuropathy')
-        if findings['pulses'] in ['diminished', 'absent']:
-            risk_factors.append('peripheral_vascular_disease')
-        if findings['skin_integrity'] != 'intact':
-            risk_factors.append('active_wound')
-        if findings['deformities']:
-            risk_factors.append('structural_deformity')
-        
-        if len(risk_factors) >= 3:
+        mask = (
+            (findings['sensation'] == 'diminished')
+            | (findings['pulses'] in ('diminished', 'absent')) << 1
+            | (findings['skin_integrity'] != 'intact') << 2
+            | bool(findings['deformities']) << 3
+        )
+        count = mask.bit_count()
+        
+        if count >= 3:
             risk = 'high'
-        elif len(risk_factors) >= 1:
+        elif count >= 1:
             risk = 'moderate'
         else:
             risk = 'low'
         
+        risk_factors = [label for bit, label in enumerate(_FOOT_RISK_FACTORS) if mask >> bit & 1]
+        
         return findings, risk_factors, risk
     
     @staticmethod
@@ -731,6 +768,52 @@ class EndocrineAssessments:
 # PSYCHOSOCIAL ASSESSMENTS
 # =============================================================================
 
+# PHQ-9 / GAD-7 items and severity bands: a total at or above CUTOFFS[i]
+# moves up to LEVELS[i + 1]
+_PHQ9_ITEMS = (
+    'little_interest', 'feeling_down', 'sleep_problems', 'tired_no_energy',
+    'appetite_changes', 'feeling_bad_about_self', 'trouble_concentrating',
+    'moving_slowly_or_restless', 'thoughts_of_death'
+)
+_PHQ9_CUTOFFS = (5, 10, 15, 20)
+_PHQ9_LEVELS = ('none_minimal', 'mild', 'moderate', 'moderately_severe', 'severe')
+
+_GAD7_ITEMS = (
+    'feeling_nervous', 'cant_stop_worrying', 'worrying_too_much',
+    'trouble_relaxing', 'restless', 'easily_annoyed', 'feeling_afraid'
+)
+_GAD7_CUTOFFS = (5, 10, 15)
+_GAD7_LEVELS = ('minimal', 'mild', 'moderate', 'severe')
+
+
+@singledispatch
+def phq9_score(data):
+    """Score one PHQ-9 response dict. Returns (total, severity)."""
+    total = sum(data.get(item, 0) for item in _PHQ9_ITEMS)
+    return total, _PHQ9_LEVELS[bisect_right(_PHQ9_CUTOFFS, total)]
+
+
+@phq9_score.register(list)
+@phq9_score.register(tuple)
+def _phq9_score_batch(rows):
+    """Score a cohort of PHQ-9 responses. Returns a list of (total, severity)."""
+    return [phq9_score(row) for row in rows]
+
+
+@singledispatch
+def gad7_score(data):
+    """Score one GAD-7 response dict. Returns (total, severity)."""
+    total = sum(data.get(item, 0) for item in _GAD7_ITEMS)
+    return total, _GAD7_LEVELS[bisect_right(_GAD7_CUTOFFS, total)]
+
+
+@gad7_score.register(list)
+@gad7_score.register(tuple)
+def _gad7_score_batch(rows):
+    """Score a cohort of GAD-7 responses. Returns a list of (total, severity)."""
+    return [gad7_score(row) for row in rows]
+
+
 class PsychosocialAssessments:
     """Assessment tools for mental health, cognition, and social support."""
     
@@ -740,31 +823,10 @@ class PsychosocialAssessments:
         PHQ-9 Depression Screening.
         9 items, each scored 0-3.
         Total: 0-27
-        """
-        total = sum([
-            data.get('little_interest', 0),
-            data.get('feeling_down', 0),
-            data.get('sleep_problems', 0),
-            data.get('tired_no_energy', 0),
-            data.get('appetite_changes', 0),
-            data.get('feeling_bad_about_self', 0),
-            data.get('trouble_concentrating', 0),
-            data.get('moving_slowly_or_restless', 0),
-            data.get('thoughts_of_death', 0)
-        ])
-        
-        if total < 5:
-            severity = 'none_minimal'
-        elif total < 10:
-            severity = 'mild'
-        elif total < 15:
-            severity = 'moderate'
-        elif total < 20:
-            severity = 'moderately_severe'
-        else:
-            severity = 'severe'
         
-        return total, severity
+        data: a dict for one patient, or a list of dicts to score a cohort.
+        """
+        return phq9_score(data)
     
     @staticmethod
     def gad7_anxiety_screening(data):
@@ -772,27 +834,10 @@ class PsychosocialAssessments:
         GAD-7 Anxiety Screening.
         7 items, each scored 0-3.
         Total: 0-21
-        """
-        total = sum([
-            data.get('feeling_nervous', 0),
-            data.get('cant_stop_worrying', 0),
-            data.get('worrying_too_much', 0),
-            data.get('trouble_relaxing', 0),
-            data.get('restless', 0),
-            data.get('easily_annoyed', 0),
-            data.get('feeling_afraid', 0)
-        ])
         
-        if total < 5:
-            severity = 'minimal'
-        elif total < 10:
-            severity = 'mild'
-        elif total < 15:
-            severity = 'moderate'
-        else:
-            severity = 'severe'
-        
-        return total, severity
+        data: a dict for one patient, or a list of dicts to score a cohort.
+        """
+        return gad7_score(data)
     
     @staticmethod
     def mini_cog(data):
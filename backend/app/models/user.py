@@ -1,13 +1,47 @@
 """User model for authentication and role-based access control."""
 from datetime import datetime
+from functools import lru_cache
+from flask import current_app
+from sqlalchemy import DDL, event
+from sqlalchemy.orm import Session
 from app import db
-import bcrypt
+
+# bcrypt is imported lazily in set_password/check_password so workers that
+# never hash don't pay for loading the extension at boot. The work factor for
+# new hashes is the app's BCRYPT_ROUNDS setting.
+
+# bcrypt only looks at the first 72 bytes of its input and silently drops the rest
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+# Keys of User.to_dict(), in order. to_dict() copies the pre-sized template
+# and fills it in place rather than building a new dict literal per user.
+_USER_FIELDS = (
+    'id', 'username', 'email', 'first_name', 'last_name', 'full_name', 'role',
+    'license_number', 'license_state', 'employee_id', 'department',
+    'is_active', 'last_login', 'created_at'
+)
+_USER_TPL = dict.fromkeys(_USER_FIELDS)
+
+# Role -> permissions; 'all' grants everything
+_ROLE_PERMISSIONS = {
+    'Admin': frozenset(['all']),
+    'RN': frozenset(['assess', 'medicate', 'document', 'care_plan', 'supervise']),
+    'LPN': frozenset(['assess', 'medicate', 'document']),
+    'CNA': frozenset(['vital_signs', 'document', 'basic_care']),
+    'Supervisor': frozenset(['assess', 'medicate', 'document', 'care_plan', 'supervise', 'review'])
+}
 
 
 class User(db.Model):
     """User model for healthcare staff."""
     
     __tablename__ = 'users'
+    __table_args__ = (
+        db.Index('ix_users_fac_active', 'facility_id', 'is_active'),
+        db.Index('ix_users_fac_role', 'facility_id', 'role'),
+        db.Index('ix_users_fullname_trgm', 'full_name', postgresql_using='gin',
+                 postgresql_ops={'full_name': 'gin_trgm_ops'}),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     facility_id = db.Column(db.Integer, db.ForeignKey('facilities.id'), nullable=False, index=True)
@@ -18,6 +52,7 @@ class User(db.Model):
     # Personal Information
     first_name = db.Column(db.String(100), nullable=False)
     last_name = db.Column(db.String(100), nullable=False)
+    full_name = db.Column(db.String(201), db.Computed("first_name || ' ' || last_name", persisted=True))
     phone = db.Column(db.String(20))  # Contact phone number
     
     # Professional Information
@@ -44,59 +79,98 @@ class User(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
+    # A staff member's visit/assessment/MAR history grows without bound and is
+    # never iterated from the User side, so these collections are write-only
+    # (query them with e.g. db.session.scalars(user.visits.select())).
     facility = db.relationship('Facility', back_populates='users')
-    visits = db.relationship('Visit', back_populates='nurse', lazy='dynamic')
-    assessments = db.relationship('Assessment', back_populates='nurse', lazy='dynamic')
+    visits = db.relationship('Visit', back_populates='nurse', lazy='write_only')
+    assessments = db.relationship('Assessment', back_populates='nurse', lazy='write_only')
     medication_administrations = db.relationship('MedicationAdministration', 
                                                   foreign_keys='MedicationAdministration.administered_by',
                                                   back_populates='administered_by_user', 
-                                                  lazy='dynamic')
+                                                  lazy='write_only')
     
     def set_password(self, password):
-        """Hash and set password."""
+        """Hash and set password.
+        
+        Raises ValueError if the password is longer than bcrypt can hash.
+        """
+        import bcrypt
+        pw = password.encode('utf-8')
+        if len(pw) > BCRYPT_MAX_PASSWORD_BYTES:
+            raise ValueError(f'Password must be at most {BCRYPT_MAX_PASSWORD_BYTES} bytes')
         self.password_hash = bcrypt.hashpw(
-            password.encode('utf-8'), 
-            bcrypt.gensalt()
+            pw, bcrypt.gensalt(current_app.config['BCRYPT_ROUNDS'])
         ).decode('utf-8')
     
     def check_password(self, password):
         """Verify password against hash."""
+        import bcrypt
         return bcrypt.checkpw(
             password.encode('utf-8'), 
             self.password_hash.encode('utf-8')
         )
     
+    def password_needs_rehash(self):
+        """True if the stored hash was made with a different BCRYPT_ROUNDS."""
+        # $2b$<rounds>$<salt><hash>
+        return int(self.password_hash.split('$')[2]) != current_app.config['BCRYPT_ROUNDS']
+    
     def has_permission(self, permission):
         """Check if user has specific permission based on role."""
-        role_permissions = {
-            'Admin': ['all'],
-            'RN': ['assess', 'medicate', 'document', 'care_plan', 'supervise'],
-            'LPN': ['assess', 'medicate', 'document'],
-            'CNA': ['vital_signs', 'document', 'basic_care'],
-            'Supervisor': ['assess', 'medicate', 'document', 'care_plan', 'supervise', 'review']
-        }
-        
-        permissions = role_permissions.get(self.role, [])
+        permissions = _ROLE_PERMISSIONS.get(self.role, frozenset())
         return 'all' in permissions or permission in permissions
     
     def to_dict(self):
-        """Convert to dictionary for API responses."""
-        return {
-            'id': self.id,
-            'username': self.username,
-            'email': self.email,
-            'first_name': self.first_name,
-            'last_name': self.last_name,
-            'full_name': f"{self.first_name} {self.last_name}",
-            'role': self.role,
-            'license_number': self.license_number,
-            'license_state': self.license_state,
-            'employee_id': self.employee_id,
-            'department': self.department,
-            'is_active': self.is_active,
-            'last_login': self.last_login.isoformat() if self.last_login else None,
-            'created_at': self.created_at.isoformat()
-        }
+        """Convert to dictionary for API responses (native types; encoded by ORJSONProvider)."""
+        d = _USER_TPL.copy()
+        d['id'] = self.id
+        d['username'] = self.username
+        d['email'] = self.email
+        d['first_name'] = self.first_name
+        d['last_name'] = self.last_name
+        d['full_name'] = self.full_name
+        d['role'] = self.role
+        d['license_number'] = self.license_number
+        d['license_state'] = self.license_state
+        d['employee_id'] = self.employee_id
+        d['department'] = self.department
+        d['is_active'] = self.is_active
+        d['last_login'] = self.last_login
+        d['created_at'] = self.created_at
+        return d
     
     def __repr__(self):
         return f'<User {self.username} ({self.role})>'
+
+
+@lru_cache(maxsize=4)
+def _dummy_hash(rounds):
+    import bcrypt
+    return bcrypt.hashpw(b'dummy-password', bcrypt.gensalt(rounds))
+
+
+def check_dummy_password(password):
+    """Do the same bcrypt work as User.check_password when there is no user.
+    
+    Keeps the unknown-username path as slow as a wrong password so response
+    time does not reveal which usernames exist. Always returns False.
+    """
+    import bcrypt
+    bcrypt.checkpw(password.encode('utf-8'), _dummy_hash(current_app.config['BCRYPT_ROUNDS']))
+    return False
+
+
+@event.listens_for(Session, 'after_flush')
+def _invalidate_current_user_cache(session, flush_context):
+    """Retire cached /api/auth/me payloads for users changed in this flush."""
+    from app.utils.cache import bump_on_commit, current_user_key
+    bump_on_commit(session, *(
+        current_user_key(obj.id)
+        for obj in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(obj, User)
+    ))
+
+
+# The trigram index on full_name needs pg_trgm (create_all path; see migrations)
+event.listen(User.__table__, 'before_create', DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
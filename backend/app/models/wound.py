@@ -1,5 +1,7 @@
 """Wound assessment model for wound care documentation."""
 from datetime import datetime
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred
 from app import db
 
 
@@ -7,6 +9,10 @@ class WoundAssessment(db.Model):
     """Comprehensive wound assessment and tracking."""
     
     __tablename__ = 'wound_assessments'
+    __table_args__ = (
+        db.Index('ix_wound_tissue_gin', 'tissue_type_percentages', postgresql_using='gin'),
+        db.Index('ix_wound_patient_date', 'patient_id', db.text('assessment_date DESC')),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     patient_id = db.Column(db.Integer, db.ForeignKey('patients.id'), nullable=False, index=True)
@@ -16,7 +22,7 @@ class WoundAssessment(db.Model):
     # Wound Identification
     wound_id = db.Column(db.String(50))  # Internal tracking ID for this specific wound
     location = db.Column(db.String(200), nullable=False)  # anatomical location
-    location_description = db.Column(db.Text)  # detailed description
+    location_description = deferred(db.Column(db.Text), group='narratives')  # detailed description
     
     # Wound Type
     wound_type = db.Column(db.String(100))  # pressure injury, surgical, venous ulcer, etc.
@@ -33,10 +39,11 @@ class WoundAssessment(db.Model):
     undermining_location = db.Column(db.String(100))  # clock position
     tunneling_cm = db.Column(db.Numeric(5, 2))
     tunneling_location = db.Column(db.String(100))  # clock position
+    area_cm2 = db.Column(db.Numeric(10, 4), db.Computed('length_cm * width_cm', persisted=True))  # stored generated column
     
     # Wound Bed
-    wound_bed_description = db.Column(db.Text)
-    tissue_type_percentages = db.Column(db.Text)  # JSON: {granulation: 60, slough: 30, etc.}
+    wound_bed_description = deferred(db.Column(db.Text), group='narratives')
+    tissue_type_percentages = deferred(db.Column(JSONB), group='narratives')  # {granulation: 60, slough: 30, etc.}
     necrotic_tissue = db.Column(db.Boolean, default=False)
     
     # Exudate
@@ -55,10 +62,10 @@ class WoundAssessment(db.Model):
     
     # Pain
     pain_level = db.Column(db.Integer)  # 0-10 scale
-    pain_description = db.Column(db.Text)
+    pain_description = deferred(db.Column(db.Text), group='narratives')
     
     # Signs of Infection
-    signs_of_infection = db.Column(db.Text)  # increased drainage, odor, fever, etc.
+    signs_of_infection = deferred(db.Column(db.Text), group='narratives')  # increased drainage, odor, fever, etc.
     
     # Treatment
     cleansing_solution = db.Column(db.String(200))
@@ -67,14 +74,14 @@ class WoundAssessment(db.Model):
     frequency_of_change = db.Column(db.String(100))
     
     # Topical Treatments
-    topical_medications = db.Column(db.Text)  # antimicrobials, growth factors, etc.
+    topical_medications = deferred(db.Column(db.Text), group='narratives')  # antimicrobials, growth factors, etc.
     
     # Offloading/Pressure Relief
-    pressure_relief_devices = db.Column(db.Text)
+    pressure_relief_devices = deferred(db.Column(db.Text), group='narratives')
     
     # Healing Progress
     healing_status = db.Column(db.String(50))  # healing, stable, deteriorating
-    compared_to_previous = db.Column(db.Text)  # comparison notes
+    compared_to_previous = deferred(db.Column(db.Text), group='narratives')  # comparison notes
     
     # Photography
     photo_taken = db.Column(db.Boolean, default=False)
@@ -82,7 +89,7 @@ class WoundAssessment(db.Model):
     
     # Assessment Notes
     notes = db.Column(db.Text)
-    plan_of_care = db.Column(db.Text)
+    plan_of_care = deferred(db.Column(db.Text), group='narratives')
     
     # Next Assessment
     next_assessment_date = db.Column(db.Date)
@@ -91,19 +98,17 @@ class WoundAssessment(db.Model):
     assessment_date = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     
+    # Narrative text columns are deferred (group 'narratives') so list queries
+    # don't pull them; the first access loads the whole group in one SELECT.
+    # `notes` stays eager because to_dict() returns it for every row.
+    
     # Relationships
     patient = db.relationship('Patient', back_populates='wounds')
     nurse = db.relationship('User')
     visit = db.relationship('Visit')
     
-    def calculate_area(self):
-        """Calculate wound area in cm²."""
-        if self.length_cm and self.width_cm:
-            return float(self.length_cm * self.width_cm)
-        return None
-    
     def to_dict(self):
-        """Convert to dictionary for API responses."""
+        """Convert to dictionary for API responses (native types; encoded by ORJSONProvider)."""
         return {
             'id': self.id,
             'patient_id': self.patient_id,
@@ -111,16 +116,16 @@ class WoundAssessment(db.Model):
             'location': self.location,
             'wound_type': self.wound_type,
             'stage': self.stage,
-            'length_cm': float(self.length_cm) if self.length_cm else None,
-            'width_cm': float(self.width_cm) if self.width_cm else None,
-            'depth_cm': float(self.depth_cm) if self.depth_cm else None,
-            'area_cm2': self.calculate_area(),
+            'length_cm': self.length_cm,
+            'width_cm': self.width_cm,
+            'depth_cm': self.depth_cm,
+            'area_cm2': self.area_cm2,
             'exudate_amount': self.exudate_amount,
             'exudate_type': self.exudate_type,
             'healing_status': self.healing_status,
             'pain_level': self.pain_level,
             'dressing_type': self.dressing_type,
-            'assessment_date': self.assessment_date.isoformat(),
+            'assessment_date': self.assessment_date,
             'assessed_by': self.assessed_by,
             'notes': self.notes
         }
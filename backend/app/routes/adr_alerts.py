@@ -1,18 +1,88 @@
 """ADR (Adverse Drug Reaction) alert routes - surveillance and monitoring."""
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, abort, request, jsonify, current_app, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from collections import defaultdict
 from datetime import datetime, timedelta
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import joinedload, raiseload
+from celery.result import EagerResult
 from app import db
 from app.models import (
-    ADRAlert, PatientObservation, Patient, User, Medication,
+    ADRAlert, PatientObservation, Patient, Medication,
     PharmacistIntervention, AuditLog
 )
-from app.services.adr_surveillance import ADRSurveillanceService
-from app.utils.permissions import require_role
+from app.tasks import analyze_observation_task, send_provider_notification_task
+from app.utils.cache import (
+    active_alerts_key, active_meds_key, bump_on_commit, cache_get_or_set_versioned
+)
+from app.utils.json_provider import stream_json
+from app.utils.permissions import require_role, get_token_user
 
 bp = Blueprint('adr_alerts', __name__, url_prefix='/api')
 
+_VALID_OBS_TYPES = frozenset(PatientObservation.OBSERVATION_TYPES)
+_FINAL_STATUSES = (ADRAlert.STATUS_CONFIRMED_ADR, ADRAlert.STATUS_NOT_ADR, ADRAlert.STATUS_DISMISSED)
+_VALID_FINAL_STATUSES = frozenset(_FINAL_STATUSES)
+_ACTIVE_STATUSES = (ADRAlert.STATUS_NEW, ADRAlert.STATUS_ACKNOWLEDGED, ADRAlert.STATUS_INVESTIGATING)
+_STREAM_BATCH_SIZE = 200
+
+# List endpoints serialize columns only; fail loudly if a to_dict() starts
+# walking relationships instead of silently issuing one query per row
+_NO_LAZY_LOADS = raiseload('*')
+
+def _authorized_patient(patient_id, user):
+    """Fetch a patient in the user's facility (any facility for Admin), else 404."""
+    query = Patient.query.filter(Patient.id == patient_id)
+    if user.role != 'Admin':
+        query = query.filter(Patient.facility_id == user.facility_id)
+    return query.first_or_404()
+
+
+def _window(days):
+    """Half-open [now - days, now) look-back range for sargable >= / < filters."""
+    now = datetime.utcnow()
+    return now - timedelta(days=days), now
+
+
+def _partitions(query, size=_STREAM_BATCH_SIZE):
+    """Run query with a server-side cursor, yielding lists of at most size rows."""
+    result = db.session.execute(query.statement.execution_options(yield_per=size))
+    return result.scalars().partitions()
+
+
+def _alert_dicts(query):
+    """
+    Serialize the alerts matched by query, reusing ADRAlert.cached_repr.
+    
+    Snapshots are stored when an alert is written (ADRAlert.snapshot_on_commit);
+    rows without one are serialized here, in memory only.
+    """
+    rows = query.with_entities(ADRAlert.id, ADRAlert.cached_repr).all()
+    stale = [alert_id for alert_id, cached in rows if cached is None]
+    fresh = {}
+    
+    if stale:
+        fresh = {
+            alert.id: alert.to_dict()
+            for alert in db.session.scalars(
+                select(ADRAlert).options(_NO_LAZY_LOADS).where(ADRAlert.id.in_(stale))
+            )
+        }
+    
+    return [
+        cached if cached is not None else fresh[alert_id]
+        for alert_id, cached in rows
+        if cached is not None or alert_id in fresh
+    ]
+
+
+def _alert_scope(alert_id, user):
+    """WHERE clauses limiting an alert to the user's facility (any for Admin)."""
+    clauses = [ADRAlert.id == alert_id]
+    if user.role != 'Admin':
+        clauses.append(ADRAlert.facility_id == user.facility_id)
+    return clauses
+
 
 @bp.route('/patients/<int:patient_id>/observations', methods=['POST'])
 @jwt_required()
@@ -21,7 +91,7 @@ def create_observation(patient_id):
     """
     Document patient observation.
     
-    This automatically triggers ADR surveillance.
+    This automatically triggers ADR surveillance as a background task.
     
     Request body:
     {
@@ -39,12 +109,10 @@ def create_observation(patient_id):
     }
     """
     current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    user = get_token_user()
     
     # Check patient access
-    patient = Patient.query.get_or_404(patient_id)
-    if patient.facility_id != user.facility_id and user.role != 'Admin':
-        return jsonify({'error': 'Access denied'}), 403
+    patient = _authorized_patient(patient_id, user)
     
     data = request.get_json()
     
@@ -52,31 +120,29 @@ def create_observation(patient_id):
     if not data.get('observation_type'):
         return jsonify({'error': 'observation_type is required'}), 400
     
-    valid_types = [
-        'SYMPTOM', 'VITAL_SIGN', 'BEHAVIOR', 
-        'PHYSICAL_FINDING', 'LAB_RESULT', 'FUNCTIONAL_CHANGE'
-    ]
-    if data['observation_type'] not in valid_types:
-        return jsonify({'error': f'observation_type must be one of: {", ".join(valid_types)}'}), 400
+    if data['observation_type'] not in _VALID_OBS_TYPES:
+        return jsonify({'error': f'observation_type must be one of: {", ".join(PatientObservation.OBSERVATION_TYPES)}'}), 400
     
     if not data.get('observation_text'):
         return jsonify({'error': 'observation_text is required'}), 400
     
     try:
         # Get patient's current medications for related_medications field
-        active_meds = Medication.query.filter_by(
-            patient_id=patient_id,
-            status='active'
-        ).all()
-        
-        related_meds = [{'id': med.id, 'name': med.name, 'dose': med.dose} for med in active_meds]
+        # (cached briefly - observations are often documented back to back)
+        related_meds = cache_get_or_set_versioned(
+            active_meds_key(patient_id),
+            lambda: [
+                dict(row._mapping) for row in db.session.execute(
+                    select(Medication.id, Medication.name, Medication.dose)
+                    .where(Medication.patient_id == patient_id, Medication.status == 'active')
+                )
+            ],
+            timeout=current_app.config['ACTIVE_MEDS_CACHE_TTL']
+        )
         
         # Parse observation datetime
         obs_datetime = data.get('observation_datetime')
-        if obs_datetime:
-            obs_datetime = datetime.fromisoformat(obs_datetime.replace('Z', '+00:00'))
-        else:
-            obs_datetime = datetime.utcnow()
+        obs_datetime = datetime.fromisoformat(obs_datetime) if obs_datetime else datetime.utcnow()
         
         # Create observation
         observation = PatientObservation(
@@ -99,25 +165,48 @@ def create_observation(patient_id):
         
         # Audit log
         AuditLog.log_action(
-            user_id=current_user_id,
+            user=user,
             action='CREATE',
             resource_type='PatientObservation',
             resource_id=observation.id,
-            details=f'Observation documented: {data["observation_type"]} - {data["observation_text"][:50]}',
-            contains_phi=True,
-            facility_id=user.facility_id
+            patient_id=patient_id,
+            description=f'Observation documented: {data["observation_type"]} - {data["observation_text"][:50]}',
+            phi_accessed=True,
+            request=request
         )
         
         db.session.commit()
         
-        # Trigger ADR surveillance (asynchronously in production)
-        alerts = ADRSurveillanceService.analyze_observation(observation.id)
+        # Trigger ADR surveillance on a worker (runs inline when no broker is configured).
+        # The observation is already saved, so a surveillance failure must not
+        # turn into an error response that invites a duplicate resubmit.
+        try:
+            result = analyze_observation_task.delay(observation.id)
+            alert_ids = result.get() if isinstance(result, EagerResult) else None
+        except Exception:
+            db.session.rollback()
+            current_app.logger.exception('ADR surveillance failed for observation %s', observation.id)
+            return jsonify({
+                'status': 'success',
+                'data': observation.to_dict(),
+                'adr_alerts_generated': 'pending',
+                'message': 'Observation documented. ADR surveillance is pending.'
+            }), 201
+        
+        if alert_ids is not None:
+            return jsonify({
+                'status': 'success',
+                'data': observation.to_dict(include_alerts=True),
+                'adr_alerts_generated': len(alert_ids),
+                'message': f'Observation documented. {len(alert_ids)} ADR alert(s) generated.' if alert_ids else 'Observation documented.'
+            }), 201
         
         return jsonify({
             'status': 'success',
-            'data': observation.to_dict(include_alerts=True),
-            'adr_alerts_generated': len(alerts),
-            'message': f'Observation documented. {len(alerts)} ADR alert(s) generated.' if alerts else 'Observation documented.'
+            'data': observation.to_dict(),
+            'adr_alerts_generated': 'pending',
+            'surveillance_task_id': result.id,
+            'message': 'Observation documented. ADR surveillance queued.'
         }), 201
         
     except ValueError as e:
@@ -139,26 +228,24 @@ def get_patient_observations(patient_id):
     - type: Filter by observation type
     - with_alerts: Only observations that generated alerts
     """
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    user = get_token_user()
     
     # Check patient access
-    patient = Patient.query.get_or_404(patient_id)
-    if patient.facility_id != user.facility_id and user.role != 'Admin':
-        return jsonify({'error': 'Access denied'}), 403
+    _authorized_patient(patient_id, user)
     
     # Parse filters
     days = int(request.args.get('days', 7))
     obs_type = request.args.get('type')
     with_alerts = request.args.get('with_alerts', 'false').lower() == 'true'
     
-    cutoff_date = datetime.utcnow() - timedelta(days=days)
+    window_start, window_end = _window(days)
     
     # Build query
-    query = PatientObservation.query.filter(
+    query = PatientObservation.query.options(_NO_LAZY_LOADS).filter(
         and_(
             PatientObservation.patient_id == patient_id,
-            PatientObservation.observation_datetime >= cutoff_date
+            PatientObservation.observation_datetime >= window_start,
+            PatientObservation.observation_datetime < window_end
         )
     )
     
@@ -168,12 +255,53 @@ def get_patient_observations(patient_id):
     if with_alerts:
         query = query.filter_by(potential_adr_detected=True)
     
-    observations = query.order_by(PatientObservation.observation_datetime.desc()).all()
+    query = query.order_by(PatientObservation.observation_datetime.desc())
+    
+    def batches():
+        for observations in _partitions(query):
+            # Load alerts for the whole batch in one query instead of one per row
+            alerts_by_obs = defaultdict(list)
+            if with_alerts:
+                for alert in ADRAlert.query.options(_NO_LAZY_LOADS).filter(
+                    ADRAlert.observation_id.in_([obs.id for obs in observations])
+                ):
+                    alerts_by_obs[alert.observation_id].append(alert)
+            
+            yield [
+                obs.to_dict(include_alerts=with_alerts, alerts=alerts_by_obs[obs.id])
+                for obs in observations
+            ]
+    
+    return Response(stream_with_context(stream_json(batches())), mimetype='application/json')
+
+
+@bp.route('/observations/<int:observation_id>/adr-alerts', methods=['GET'])
+@jwt_required()
+def get_observation_adr_alerts(observation_id):
+    """
+    Get ADR alerts generated for an observation.
+    
+    Poll this after create_observation returns adr_alerts_generated='pending';
+    surveillance_complete turns true once the worker has analyzed it.
+    """
+    user = get_token_user()
+    
+    query = PatientObservation.query.filter(PatientObservation.id == observation_id)
+    if user.role != 'Admin':
+        query = query.filter(PatientObservation.facility_id == user.facility_id)
+    observation = query.first_or_404()
+    
+    alerts = ADRAlert.query.options(_NO_LAZY_LOADS).filter_by(observation_id=observation_id).order_by(
+        ADRAlert.urgency_rank,
+        ADRAlert.created_at.desc()
+    ).all()
     
     return jsonify({
         'status': 'success',
-        'data': [obs.to_dict(include_alerts=with_alerts) for obs in observations],
-        'count': len(observations)
+        'data': [alert.to_dict() for alert in alerts],
+        'count': len(alerts),
+        'observation_id': observation_id,
+        'surveillance_complete': observation.adr_surveillance_performed
     })
 
 
@@ -189,9 +317,13 @@ def get_adr_alerts():
     - confidence: Minimum confidence level
     - patient_id: Filter by patient
     - days: Look back days (default 7)
+    - page: Page number (default 1)
+    - per_page: Alerts per page (default 50, max 200)
+    
+    Callers that only need a count should read total rather than len(data).
     """
     current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    user = get_token_user()
     
     # Parse filters
     status = request.args.get('status')
@@ -199,14 +331,17 @@ def get_adr_alerts():
     confidence = request.args.get('confidence')
     patient_id = request.args.get('patient_id')
     days = int(request.args.get('days', 7))
+    page = max(int(request.args.get('page', 1)), 1)
+    per_page = min(max(int(request.args.get('per_page', 50)), 1), 200)
     
-    cutoff_date = datetime.utcnow() - timedelta(days=days)
+    window_start, window_end = _window(days)
     
     # Build query - filter by facility
     query = ADRAlert.query.filter(
         and_(
             ADRAlert.facility_id == user.facility_id,
-            ADRAlert.created_at >= cutoff_date
+            ADRAlert.created_at >= window_start,
+            ADRAlert.created_at < window_end
         )
     )
     
@@ -229,26 +364,20 @@ def get_adr_alerts():
         query = query.filter_by(patient_id=int(patient_id))
     
     # Order by urgency
-    urgency_order = db.case(
-        (ADRAlert.provider_notification_urgency == 'STAT', 1),
-        (ADRAlert.provider_notification_urgency == 'URGENT', 2),
-        (ADRAlert.provider_notification_urgency == 'ROUTINE', 3),
-        else_=4
-    )
+    ordered = query.order_by(ADRAlert.urgency_rank, ADRAlert.created_at.desc())
     
-    alerts = query.order_by(
-        urgency_order,
-        ADRAlert.created_at.desc()
-    ).all()
+    result = _alert_dicts(ordered.limit(per_page).offset((page - 1) * per_page))
     
-    # Enrich with patient info
-    result = []
-    for alert in alerts:
-        alert_dict = alert.to_dict()
-        patient = Patient.query.get(alert.patient_id)
-        alert_dict['patient_name'] = f"{patient.first_name} {patient.last_name}"
-        alert_dict['patient_room'] = getattr(patient, 'room_number', None)
-        result.append(alert_dict)
+    # A partial, non-empty page (or an empty first page) already pins down
+    # the total; only run COUNT(*) when more rows may follow
+    if len(result) < per_page and (result or page == 1):
+        total = (page - 1) * per_page + len(result)
+    else:
+        total = query.with_entities(func.count(ADRAlert.id)).scalar()
+    
+    # patient_name is denormalized onto the alert; Patient has no room column yet
+    for alert_dict in result:
+        alert_dict['patient_room'] = None
     
     # Audit log
     AuditLog.log_access(
@@ -265,6 +394,10 @@ def get_adr_alerts():
         'status': 'success',
         'data': result,
         'count': len(result),
+        'total': total,
+        'page': page,
+        'per_page': per_page,
+        'pages': -(-total // per_page),
         'filters': {
             'status': status,
             'severity': severity,
@@ -279,58 +412,59 @@ def get_adr_alerts():
 @jwt_required()
 def get_patient_adr_alerts(patient_id):
     """Get ADR alerts for specific patient."""
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    user = get_token_user()
     
     # Check patient access
-    patient = Patient.query.get_or_404(patient_id)
-    if patient.facility_id != user.facility_id and user.role != 'Admin':
-        return jsonify({'error': 'Access denied'}), 403
+    _authorized_patient(patient_id, user)
     
     # Parse filters
     status = request.args.get('status')
     days = int(request.args.get('days', 30))
     
-    cutoff_date = datetime.utcnow() - timedelta(days=days)
+    window_start, window_end = _window(days)
     
-    query = ADRAlert.query.filter(
+    query = ADRAlert.query.options(_NO_LAZY_LOADS).filter(
         and_(
             ADRAlert.patient_id == patient_id,
-            ADRAlert.created_at >= cutoff_date
+            ADRAlert.created_at >= window_start,
+            ADRAlert.created_at < window_end
         )
     )
     
     if status:
         query = query.filter_by(status=status)
     
-    alerts = query.order_by(ADRAlert.created_at.desc()).all()
+    query = query.order_by(ADRAlert.created_at.desc())
+    batches = ([alert.to_dict() for alert in alerts] for alerts in _partitions(query))
     
-    return jsonify({
-        'status': 'success',
-        'data': [alert.to_dict() for alert in alerts],
-        'count': len(alerts),
-        'patient_id': patient_id
-    })
+    return Response(
+        stream_with_context(stream_json(batches, patient_id=patient_id)),
+        mimetype='application/json'
+    )
 
 
 @bp.route('/adr-alerts/<int:alert_id>', methods=['GET'])
 @jwt_required()
 def get_adr_alert_details(alert_id):
     """Get detailed information about specific ADR alert."""
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
-    
-    alert = ADRAlert.query.get_or_404(alert_id)
-    
-    # Check access
-    if alert.facility_id != user.facility_id and user.role != 'Admin':
-        return jsonify({'error': 'Access denied'}), 403
+    user = get_token_user()
+    
+    # Related records are many-to-one, so join them into the single alert SELECT;
+    # the facility scope is part of the same query
+    alert = ADRAlert.query.options(
+        joinedload(ADRAlert.patient).load_only(
+            Patient.id, Patient.first_name, Patient.last_name, Patient.is_hospice
+        ),
+        joinedload(ADRAlert.medication),
+        joinedload(ADRAlert.observation),
+        joinedload(ADRAlert.pharmacist_intervention)
+    ).filter(*_alert_scope(alert_id, user)).first_or_404()
     
     # Enrich with related data
     result = alert.to_dict()
     
     # Add patient info
-    patient = Patient.query.get(alert.patient_id)
+    patient = alert.patient
     result['patient'] = {
         'id': patient.id,
         'name': f"{patient.first_name} {patient.last_name}",
@@ -339,17 +473,14 @@ def get_adr_alert_details(alert_id):
     }
     
     # Add medication info
-    medication = Medication.query.get(alert.medication_id)
-    result['medication'] = medication.to_dict()
+    result['medication'] = alert.medication.to_dict()
     
     # Add observation info
-    observation = PatientObservation.query.get(alert.observation_id)
-    result['observation'] = observation.to_dict()
+    result['observation'] = alert.observation.to_dict()
     
     # Add pharmacist intervention if exists
-    if alert.pharmacist_intervention_id:
-        intervention = PharmacistIntervention.query.get(alert.pharmacist_intervention_id)
-        result['pharmacist_intervention'] = intervention.to_dict()
+    if alert.pharmacist_intervention:
+        result['pharmacist_intervention'] = alert.pharmacist_intervention.to_dict()
     
     return jsonify({
         'status': 'success',
@@ -389,24 +520,26 @@ def acknowledge_alert(alert_id):
     import logging
     
     current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
-    
-    current_app.logger.info(f"🔔 ADR ALERT ACKNOWLEDGMENT | Alert #{alert_id} | User: {user.username} ({user.role})")
-    
-    alert = ADRAlert.query.get_or_404(alert_id)
-    current_app.logger.info(f"   Alert: {alert.alert_type} - {alert.severity} | Status: {alert.status} | Patient: {alert.patient_id}")
+    user = get_token_user()
+    
+    # Row lock serializes concurrent acknowledgments of this alert, so the
+    # existing-acknowledgment check and insert below cannot race
+    alert = db.session.get(ADRAlert, alert_id, with_for_update=True) or abort(404)
+    current_app.logger.info(
+        'ADR ALERT ACKNOWLEDGMENT | Alert #%s | User: %s (%s) | %s - %s | Status: %s | Patient: %s',
+        alert_id, user.username, user.role, alert.suspected_reaction, alert.severity, alert.status, alert.patient_id
+    )
     
     # Check access
     if alert.facility_id != user.facility_id and user.role != 'Admin':
-        current_app.logger.warning(f"   ❌ Access denied - facility mismatch")
+        current_app.logger.warning('Acknowledgment of alert #%s denied - facility mismatch', alert_id)
         return jsonify({'error': 'Access denied'}), 403
     
     if not alert.is_active:
-        current_app.logger.warning(f"   ❌ Cannot acknowledge - alert not active: {alert.status}")
+        current_app.logger.warning('Cannot acknowledge alert #%s - not active: %s', alert_id, alert.status)
         return jsonify({'error': f'Alert is not active (status: {alert.status})'}), 400
     
     data = request.get_json() or {}
-    current_app.logger.info(f"   Acknowledgment action: {data.get('action', 'ACKNOWLEDGED')}")
     
     # Validate required fields
     action = data.get('action', 'ACKNOWLEDGED')
@@ -439,7 +572,10 @@ def acknowledge_alert(alert_id):
         ).order_by(ADRAlertAcknowledgment.acknowledged_at.desc()).first()
         
         if existing and existing.is_valid:
-            print(f"   ℹ️ User already has valid acknowledgment (expires: {existing.expires_at})")
+            current_app.logger.debug(
+                'User %s already has a valid acknowledgment of alert %s (expires %s)',
+                current_user_id, alert_id, existing.expires_at
+            )
             return jsonify({
                 'status': 'success',
                 'data': existing.to_dict(),
@@ -468,7 +604,7 @@ def acknowledge_alert(alert_id):
             acknowledgment.hold_duration = data.get('hold_duration')
             acknowledgment.provider_notified = data.get('provider_notified', False)
             if data.get('provider_notified_at'):
-                acknowledgment.provider_notified_at = datetime.fromisoformat(data['provider_notified_at'].replace('Z', '+00:00'))
+                acknowledgment.provider_notified_at = datetime.fromisoformat(data['provider_notified_at'])
             acknowledgment.hold_order_obtained = data.get('hold_order_obtained', False)
         
         db.session.add(acknowledgment)
@@ -493,9 +629,14 @@ def acknowledge_alert(alert_id):
         
         db.session.commit()
         
-        current_app.logger.info(f"   ✅ ACKNOWLEDGMENT CREATED | ID: {acknowledgment.id} | Expires: {acknowledgment.expires_at.strftime('%Y-%m-%d %H:%M')}")
-        user_logger = logging.getLogger('user_actions')
-        user_logger.info(f"ADR ALERT ACKNOWLEDGED | User: {user.username} | Alert: #{alert_id} | Action: {action} | Patient: {alert.patient_id}")
+        current_app.logger.info(
+            'ACKNOWLEDGMENT CREATED | ID: %s | Action: %s | Expires: %s',
+            acknowledgment.id, action, acknowledgment.expires_at
+        )
+        logging.getLogger('user_actions').info(
+            'ADR ALERT ACKNOWLEDGED | User: %s | Alert: #%s | Action: %s | Patient: %s',
+            user.username, alert_id, action, alert.patient_id
+        )
         
         return jsonify({
             'status': 'success',
@@ -508,7 +649,7 @@ def acknowledge_alert(alert_id):
         
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"   ❌ ERROR: {str(e)}", exc_info=True)
+        current_app.logger.error('Acknowledgment of alert #%s failed: %s', alert_id, e, exc_info=True)
         return jsonify({'error': str(e)}), 500
 
 
@@ -525,9 +666,9 @@ def escalate_to_pharmacist(alert_id):
     }
     """
     current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    user = get_token_user()
     
-    alert = ADRAlert.query.get_or_404(alert_id)
+    alert = db.get_or_404(ADRAlert, alert_id)
     
     # Check access
     if alert.facility_id != user.facility_id and user.role != 'Admin':
@@ -562,13 +703,14 @@ def escalate_to_pharmacist(alert_id):
         
         # Audit log
         AuditLog.log_action(
-            user_id=current_user_id,
+            user=user,
             action='CREATE',
             resource_type='PharmacistIntervention',
             resource_id=intervention.id,
-            details=f'Escalated ADR alert {alert_id} to pharmacist',
-            contains_phi=True,
-            facility_id=user.facility_id
+            patient_id=alert.patient_id,
+            description=f'Escalated ADR alert {alert_id} to pharmacist',
+            phi_accessed=True,
+            request=request
         )
         
         db.session.commit()
@@ -602,46 +744,61 @@ def notify_provider(alert_id):
     }
     """
     current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
-    
-    alert = ADRAlert.query.get_or_404(alert_id)
-    
-    # Check access
-    if alert.facility_id != user.facility_id and user.role != 'Admin':
-        return jsonify({'error': 'Access denied'}), 403
+    user = get_token_user()
     
     data = request.get_json() or {}
     
     try:
-        alert.provider_notified = True
-        alert.provider_notified_at = datetime.utcnow()
-        alert.provider_response = data.get('provider_response')
-        
-        # Update investigation notes
-        notification_note = f"\n[{datetime.utcnow().strftime('%Y-%m-%d %H:%M')}] Provider notified via {data.get('notification_method', 'unspecified')}. "
-        if data.get('provider_name'):
-            notification_note += f"Provider: {data['provider_name']}. "
-        if data.get('provider_response'):
-            notification_note += f"Response: {data['provider_response']}"
-        
-        if alert.investigation_notes:
-            alert.investigation_notes += notification_note
-        else:
-            alert.investigation_notes = notification_note
+        # Single UPDATE ... RETURNING: access check, flags and note append in one round-trip
+        alert = db.session.execute(
+            update(ADRAlert)
+            .where(*_alert_scope(alert_id, user))
+            .values(
+                provider_notified=True,
+                provider_notified_at=datetime.utcnow(),
+                provider_response=data.get('provider_response'),
+                investigation_notes=ADRAlert.investigation_note_appended(
+                    user_id=current_user_id,
+                    event='PROVIDER_NOTIFIED',
+                    method=data.get('notification_method', 'unspecified'),
+                    provider=data.get('provider_name'),
+                    response=data.get('provider_response')
+                )
+            )
+            .returning(ADRAlert)
+        ).scalar_one_or_none()
+        
+        if alert is None:
+            return jsonify({'error': 'Alert not found'}), 404
+        
+        ADRAlert.snapshot_on_commit(db.session, alert.id)
         
         # Audit log
         AuditLog.log_action(
-            user_id=current_user_id,
+            user=user,
             action='UPDATE',
             resource_type='ADRAlert',
             resource_id=alert.id,
-            details=f'Notified provider about ADR alert for patient {alert.patient_id}',
-            contains_phi=True,
-            facility_id=user.facility_id
+            patient_id=alert.patient_id,
+            description=f'Notified provider about ADR alert for patient {alert.patient_id}',
+            phi_accessed=True,
+            request=request
         )
         
         db.session.commit()
         
+        # External delivery (SMS/email/pager) runs on the notifications queue.
+        # The notification is already documented, so a delivery failure
+        # (raised inline in eager mode) is logged rather than returned as 500.
+        try:
+            send_provider_notification_task.delay(alert.id, {
+                'method': data.get('notification_method'),
+                'provider_name': data.get('provider_name')
+            })
+        except Exception:
+            db.session.rollback()
+            current_app.logger.exception('Provider notification dispatch failed for alert %s', alert.id)
+        
         return jsonify({
             'status': 'success',
             'data': alert.to_dict(),
@@ -662,19 +819,53 @@ def check_patient_acknowledgments(patient_id):
     
     Must be called before administering medications to ensure staff awareness.
     Returns list of unacknowledged alerts (if any) and expired acknowledgments.
+    
+    With ?summary=true, a caller that only needs the can_administer gate gets
+    a single EXISTS check when everything is acknowledged; the full payload is
+    built only when administration is blocked.
     """
     from app.models import ADRAlertAcknowledgment
     
     current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    user = get_token_user()
+    
+    active_filter = (
+        ADRAlert.patient_id == patient_id,
+        ADRAlert.facility_id == user.facility_id,
+        ADRAlert.status.in_(_ACTIVE_STATUSES)
+    )
+    
+    # Most patients have no active alerts; answer that from the cache. The key
+    # is versioned so a read racing a new alert's commit can't re-cache "none"
+    active_ids = cache_get_or_set_versioned(
+        active_alerts_key(user.facility_id, patient_id),
+        lambda: db.session.scalars(select(ADRAlert.id).where(*active_filter)).all(),
+        timeout=current_app.config['ACTIVE_ALERTS_CACHE_TTL']
+    )
+    
+    if active_ids and request.args.get('summary', 'false').lower() == 'true':
+        # Is any active alert missing an unexpired acknowledgment by this user?
+        valid_ack = select(ADRAlertAcknowledgment.id).where(
+            ADRAlertAcknowledgment.alert_id == ADRAlert.id,
+            ADRAlertAcknowledgment.user_id == current_user_id,
+            ADRAlertAcknowledgment.expires_at > datetime.utcnow()
+        ).exists()
+        blocked = db.session.scalar(select(
+            select(ADRAlert.id).where(*active_filter, ~valid_ack).exists()
+        ))
+        if not blocked:
+            return jsonify({
+                'status': 'success',
+                'can_administer': True,
+                'message': 'All alerts acknowledged',
+                'unacknowledged_alerts': [],
+                'expired_acknowledgments': []
+            })
     
     # Get all active alerts for this patient
-    active_alerts = ADRAlert.query.filter_by(
-        patient_id=patient_id,
-        facility_id=user.facility_id
-    ).filter(
-        ADRAlert.status.in_(['NEW', 'ACKNOWLEDGED', 'INVESTIGATING'])
-    ).all()
+    active_alerts = (
+        ADRAlert.query.options(_NO_LAZY_LOADS).filter(*active_filter).all() if active_ids else []
+    )
     
     if not active_alerts:
         return jsonify({
@@ -686,23 +877,32 @@ def check_patient_acknowledgments(patient_id):
             'expired_acknowledgments': []
         })
     
+    # User's most recent acknowledgment per alert, in one query (DISTINCT ON)
+    latest_acks = {
+        ack.alert_id: ack
+        for ack in ADRAlertAcknowledgment.query.options(_NO_LAZY_LOADS).filter(
+            ADRAlertAcknowledgment.alert_id.in_([alert.id for alert in active_alerts]),
+            ADRAlertAcknowledgment.user_id == current_user_id
+        ).distinct(ADRAlertAcknowledgment.alert_id).order_by(
+            ADRAlertAcknowledgment.alert_id,
+            ADRAlertAcknowledgment.acknowledged_at.desc()
+        )
+    }
+    
     # Check acknowledgments for each alert
+    alert_dicts = [alert.to_dict() for alert in active_alerts]
     unacknowledged = []
     expired = []
     valid_acks = []
     
-    for alert in active_alerts:
-        # Get user's most recent acknowledgment
-        ack = ADRAlertAcknowledgment.query.filter_by(
-            alert_id=alert.id,
-            user_id=current_user_id
-        ).order_by(ADRAlertAcknowledgment.acknowledged_at.desc()).first()
+    for alert, alert_dict in zip(active_alerts, alert_dicts):
+        ack = latest_acks.get(alert.id)
         
         if not ack:
-            unacknowledged.append(alert.to_dict())
+            unacknowledged.append(alert_dict)
         elif ack.is_expired:
             expired.append({
-                'alert': alert.to_dict(),
+                'alert': alert_dict,
                 'expired_acknowledgment': ack.to_dict()
             })
         else:
@@ -714,7 +914,7 @@ def check_patient_acknowledgments(patient_id):
         'status': 'success',
         'can_administer': can_administer,
         'message': 'All alerts acknowledged' if can_administer else 'Some alerts require acknowledgment',
-        'active_alerts': [a.to_dict() for a in active_alerts],
+        'active_alerts': alert_dicts,
         'unacknowledged_alerts': unacknowledged,
         'expired_acknowledgments': expired,
         'valid_acknowledgments': valid_acks
@@ -736,42 +936,51 @@ def resolve_alert(alert_id):
     }
     """
     current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
-    
-    alert = ADRAlert.query.get_or_404(alert_id)
-    
-    # Check access
-    if alert.facility_id != user.facility_id and user.role != 'Admin':
-        return jsonify({'error': 'Access denied'}), 403
+    user = get_token_user()
     
     data = request.get_json()
     
     # Validate status
-    valid_final_statuses = ['CONFIRMED_ADR', 'NOT_ADR', 'DISMISSED']
-    if not data.get('status') or data['status'] not in valid_final_statuses:
+    if not data.get('status') or data['status'] not in _VALID_FINAL_STATUSES:
         return jsonify({
-            'error': f'status must be one of: {", ".join(valid_final_statuses)}'
+            'error': f'status must be one of: {", ".join(_FINAL_STATUSES)}'
         }), 400
     
     if not data.get('outcome_notes'):
         return jsonify({'error': 'outcome_notes required when resolving alert'}), 400
     
     try:
-        alert.status = data['status']
-        alert.outcome = data['outcome_notes']
-        alert.action_taken = data.get('action_taken')
-        alert.resolved_at = datetime.utcnow()
-        alert.resolved_by_user_id = current_user_id
+        alert = db.session.execute(
+            update(ADRAlert)
+            .where(*_alert_scope(alert_id, user))
+            .values(
+                status=data['status'],
+                outcome=data['outcome_notes'],
+                action_taken=data.get('action_taken'),
+                resolved_at=datetime.utcnow(),
+                resolved_by_user_id=current_user_id
+            )
+            .returning(ADRAlert)
+        ).scalar_one_or_none()
+        
+        if alert is None:
+            return jsonify({'error': 'Alert not found'}), 404
+        
+        # Core UPDATE bypasses the flush hooks that normally invalidate this
+        # and rebuild the dashboard snapshot
+        bump_on_commit(db.session, active_alerts_key(alert.facility_id, alert.patient_id))
+        ADRAlert.snapshot_on_commit(db.session, alert.id)
         
         # Audit log
         AuditLog.log_action(
-            user_id=current_user_id,
+            user=user,
             action='UPDATE',
             resource_type='ADRAlert',
             resource_id=alert.id,
-            details=f'Resolved ADR alert as {data["status"]} for patient {alert.patient_id}',
-            contains_phi=True,
-            facility_id=user.facility_id
+            patient_id=alert.patient_id,
+            description=f'Resolved ADR alert as {data["status"]} for patient {alert.patient_id}',
+            phi_accessed=True,
+            request=request
         )
         
         db.session.commit()
@@ -802,10 +1011,9 @@ def reset_all_acknowledgments():
     from flask import current_app
     import logging
     
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    user = get_token_user()
     
-    current_app.logger.warning(f"🔄 RESET ALL ACKNOWLEDGMENTS | Admin: {user.username}")
+    current_app.logger.warning('RESET ALL ACKNOWLEDGMENTS | Admin: %s', user.username)
     
     try:
         # Count before
@@ -835,9 +1043,11 @@ def reset_all_acknowledgments():
         
         db.session.commit()
         
-        current_app.logger.info(f"   ✅ Reset complete: {count_before} acknowledgments deleted, {len(alerts)} alerts reset")
-        user_logger = logging.getLogger('user_actions')
-        user_logger.info(f"SYSTEM RESET | Admin: {user.username} | Deleted {count_before} acknowledgments | Reset {len(alerts)} alerts")
+        current_app.logger.info('Reset complete: %s acknowledgments deleted, %s alerts reset', count_before, len(alerts))
+        logging.getLogger('user_actions').info(
+            'SYSTEM RESET | Admin: %s | Deleted %s acknowledgments | Reset %s alerts',
+            user.username, count_before, len(alerts)
+        )
         
         return jsonify({
             'status': 'success',
@@ -850,5 +1060,5 @@ def reset_all_acknowledgments():
         
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"   ❌ Reset failed: {str(e)}", exc_info=True)
+        current_app.logger.error('Reset failed: %s', e, exc_info=True)
         return jsonify({'error': str(e)}), 500
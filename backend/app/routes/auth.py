@@ -1,16 +1,30 @@
 """Authentication routes."""
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
 from flask_jwt_extended import (
     create_access_token, create_refresh_token,
     jwt_required, get_jwt_identity, get_jwt
 )
-from datetime import datetime
+from datetime import datetime, timedelta
+from sqlalchemy import case, func, update
+from sqlalchemy.orm import raiseload
 from app import db
-from app.models.user import User
+from app.models.user import BCRYPT_MAX_PASSWORD_BYTES, User, check_dummy_password
 from app.models.audit_log import AuditLog
+from app.utils.cache import (
+    cache_delete, cache_get_or_set_versioned, cache_incr, current_user_key, login_attempts_key
+)
+from app.utils.permissions import get_token_user, user_claims
 
 bp = Blueprint('auth', __name__, url_prefix='/api/auth')
 
+# Lock the account for LOCKOUT_DURATION after this many consecutive bad passwords
+MAX_FAILED_LOGINS = 5
+LOCKOUT_DURATION = timedelta(minutes=30)
+
+# User.to_dict() and the token claims read columns only; any relationship
+# access on these fetches is a bug, so raise instead of lazy-loading
+_NO_LAZY_LOADS = raiseload('*')
+
 
 @bp.route('/login', methods=['POST'])
 def login():
@@ -22,60 +36,82 @@ def login():
     
     username = data['username']
     password = data['password']
+    now = datetime.utcnow()
+    
+    # Throttle guessing per (IP, username) in Redis before any bcrypt or DB work
+    attempts_key = login_attempts_key(request.remote_addr, username)
+    recent_attempts = cache_incr(attempts_key, current_app.config['LOGIN_RATE_WINDOW'])
+    if recent_attempts and recent_attempts > current_app.config['LOGIN_RATE_LIMIT']:
+        return jsonify({'error': 'Too many login attempts. Please try again later.'}), 429
     
     # Find user
-    user = User.query.filter_by(username=username).first()
+    user = User.query.options(_NO_LAZY_LOADS).filter_by(username=username).first()
+    
+    # Always do one bcrypt check (a dummy one for unknown usernames) and give
+    # every failure the same 401, so neither timing nor the response reveals
+    # whether the username exists or the account is locked or inactive.
+    # The specific reason only goes to the audit log.
+    if user:
+        password_ok = user.check_password(password)
+    else:
+        password_ok = check_dummy_password(password)
     
     if not user:
-        AuditLog.log_action(
-            user=None,
-            action='login_failed',
-            resource_type='auth',
-            description=f'Failed login attempt for username: {username}',
-            request=request
+        reason = f'Failed login attempt for username: {username}'
+    elif user.account_locked_until and user.account_locked_until > now:
+        reason = 'Account temporarily locked'
+    elif not user.is_active:
+        reason = 'Account is inactive'
+    elif not password_ok:
+        reason = 'Invalid password'
+        # Increment in SQL so concurrent bad logins can't both write N+1 and
+        # undercount toward the lockout
+        attempts = func.coalesce(User.failed_login_attempts, 0) + 1
+        db.session.execute(
+            update(User)
+            .where(User.id == user.id)
+            .values(
+                failed_login_attempts=attempts,
+                account_locked_until=case(
+                    (attempts >= MAX_FAILED_LOGINS, now + LOCKOUT_DURATION),
+                    else_=User.account_locked_until
+                )
+            ),
+            execution_options={'synchronize_session': False}
         )
-        return jsonify({'error': 'Invalid credentials'}), 401
+    else:
+        reason = None
     
-    # Check if account is locked
-    if user.account_locked_until and user.account_locked_until > datetime.utcnow():
-        return jsonify({'error': 'Account temporarily locked. Please try again later.'}), 403
-    
-    # Check if account is active
-    if not user.is_active:
-        return jsonify({'error': 'Account is inactive'}), 403
-    
-    # Verify password
-    if not user.check_password(password):
-        user.failed_login_attempts += 1
-        
-        # Lock account after 5 failed attempts
-        if user.failed_login_attempts >= 5:
-            from datetime import timedelta
-            user.account_locked_until = datetime.utcnow() + timedelta(minutes=30)
-        
-        db.session.commit()
-        
+    if reason:
         AuditLog.log_action(
             user=user,
             action='login_failed',
             resource_type='auth',
-            description='Invalid password',
+            description=reason,
             request=request
         )
-        
+        db.session.commit()
         return jsonify({'error': 'Invalid credentials'}), 401
     
     # Reset failed attempts on successful login
     user.failed_login_attempts = 0
     user.account_locked_until = None
-    user.last_login = datetime.utcnow()
-    db.session.commit()
-    
-    # Create tokens
-    access_token = create_access_token(identity=user.id)
+    user.last_login = now
+    
+    # Bring hashes made under an older BCRYPT_ROUNDS up to the current cost
+    # while the plaintext is at hand; saved with the login commit
+    if user.password_needs_rehash():
+        try:
+            user.set_password(password)
+        except ValueError:
+            pass
+    
+    # Create tokens (before the commit expires the loaded user)
+    access_token = create_access_token(identity=user.id, additional_claims=user_claims(user))
     refresh_token = create_refresh_token(identity=user.id)
+    user_data = user.to_dict()
     
-    # Log successful login
+    # Log successful login; the buffered entry is written in the same commit
     AuditLog.log_action(
         user=user,
         action='login',
@@ -83,11 +119,13 @@ def login():
         description='Successful login',
         request=request
     )
+    db.session.commit()
+    cache_delete(attempts_key)
     
     return jsonify({
         'access_token': access_token,
         'refresh_token': refresh_token,
-        'user': user.to_dict()
+        'user': user_data
     }), 200
 
 
@@ -96,17 +134,23 @@ def login():
 def refresh():
     """Refresh access token using refresh token."""
     identity = get_jwt_identity()
-    access_token = create_access_token(identity=identity)
+    user = db.session.get(User, identity, options=[_NO_LAZY_LOADS])
+    
+    if not user:
+        return jsonify({'error': 'User not found'}), 404
+    
+    access_token = create_access_token(identity=identity, additional_claims=user_claims(user))
     
-    return jsonify({'access_token': access_token}), 200
+    # The user is already loaded; return it so clients needn't follow up with /me
+    return jsonify({'access_token': access_token, 'user': user.to_dict()}), 200
 
 
 @bp.route('/logout', methods=['POST'])
 @jwt_required()
 def logout():
     """Logout user (client should discard tokens)."""
-    user_id = get_jwt_identity()
-    user = User.query.get(user_id)
+    # The audit entry needs only id, username and role, which the token carries
+    user = get_token_user()
     
     if user:
         AuditLog.log_action(
@@ -125,45 +169,65 @@ def logout():
 def get_current_user():
     """Get current authenticated user info."""
     user_id = get_jwt_identity()
-    user = User.query.get(user_id)
     
-    if not user:
+    def load_user():
+        user = db.session.get(User, user_id, options=[_NO_LAZY_LOADS])
+        return user.to_dict() if user else None
+    
+    # Polled on most SPA route changes; cached until the user row changes
+    # (versioned, so an in-flight read can't re-cache a pre-deactivation profile)
+    user_data = cache_get_or_set_versioned(
+        current_user_key(user_id),
+        load_user,
+        timeout=current_app.config['CURRENT_USER_CACHE_TTL']
+    )
+    
+    if not user_data:
         return jsonify({'error': 'User not found'}), 404
     
-    return jsonify(user.to_dict()), 200
+    # Let the browser revalidate with If-None-Match and get an empty 304
+    # while the profile is unchanged
+    response = jsonify(user_data)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.add_etag()
+    return response.make_conditional(request)
 
 
 @bp.route('/change-password', methods=['POST'])
 @jwt_required()
 def change_password():
     """Change user password."""
-    user_id = get_jwt_identity()
-    user = User.query.get(user_id)
-    
-    if not user:
-        return jsonify({'error': 'User not found'}), 404
-    
-    data = request.get_json()
+    data = request.get_json() or {}
     old_password = data.get('old_password')
     new_password = data.get('new_password')
     
+    # Cheap checks first; a malformed request shouldn't cost a bcrypt verify
     if not old_password or not new_password:
         return jsonify({'error': 'Old and new passwords required'}), 400
     
-    # Verify old password
-    if not user.check_password(old_password):
-        return jsonify({'error': 'Invalid old password'}), 401
-    
-    # Validate new password
-    from flask import current_app
     if len(new_password) < current_app.config['PASSWORD_MIN_LENGTH']:
         return jsonify({
             'error': f'Password must be at least {current_app.config["PASSWORD_MIN_LENGTH"]} characters'
         }), 400
     
-    # Set new password
+    if len(new_password.encode('utf-8')) > BCRYPT_MAX_PASSWORD_BYTES:
+        return jsonify({'error': f'Password must be at most {BCRYPT_MAX_PASSWORD_BYTES} bytes'}), 400
+    
+    if new_password == old_password:
+        return jsonify({'error': 'New password must be different from the old password'}), 400
+    
+    user_id = get_jwt_identity()
+    user = db.session.get(User, user_id, options=[_NO_LAZY_LOADS])
+    
+    if not user:
+        return jsonify({'error': 'User not found'}), 404
+    
+    # Verify old password
+    if not user.check_password(old_password):
+        return jsonify({'error': 'Invalid old password'}), 401
+    
     user.set_password(new_password)
-    db.session.commit()
     
     AuditLog.log_action(
         user=user,
@@ -172,5 +236,6 @@ def change_password():
         description='Password changed',
         request=request
     )
+    db.session.commit()
     
     return jsonify({'message': 'Password changed successfully'}), 200
@@ -1,46 +1,252 @@
 """Care Plan API routes."""
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
-from datetime import datetime, timedelta
+from flask import Blueprint, current_app, request, jsonify
+from flask_jwt_extended import jwt_required
+from ciso8601 import parse_datetime
+from sqlalchemy import Date, cast, func, insert, select, tuple_
+from sqlalchemy.orm import raiseload, selectinload
 from app import db
 from app.models import (
     CarePlan, NursingIntervention, PhysicianOrder, AssistanceTask,
     InterventionCompletion, OrderCompletion, TaskCompletion,
-    Patient, User
+    Patient
 )
+from app.utils.cache import cache_get_or_set, cache_get_or_set_versioned, care_plan_owner_key, care_plans_key
 from app.utils.logging import app_logger
+from app.utils.permissions import get_token_user
 
 bp = Blueprint('care_plans', __name__, url_prefix='/api/care-plans')
 
+_NURSE_ROLES = frozenset(('RN', 'LPN', 'Admin'))
+_RN_ADMIN_ROLES = frozenset(('RN', 'Admin'))
+
+# Fields PUT may set directly; status is handled separately for its side effects
+_CARE_PLAN_UPDATABLE = frozenset(('plan_name', 'plan_type', 'care_goals', 'clinical_summary', 'discharge_plan'))
+_INTERVENTION_UPDATABLE = frozenset(('frequency', 'assigned_user_id'))
+
+# UTC timestamp from the database clock (columns are naive UTC, like utcnow())
+_DB_NOW = func.timezone('utc', func.now())
+
+# Keyset page sizes for list endpoints (?limit=, ?after=<next_cursor>)
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+# Columns of CarePlan.to_dict(), selected directly so list rows skip ORM hydration
+CARE_PLAN_LIST_COLS = (
+    CarePlan.id, CarePlan.patient_id, CarePlan.facility_id,
+    CarePlan.plan_name, CarePlan.plan_type, CarePlan.primary_diagnosis, CarePlan.care_goals,
+    CarePlan.start_date, CarePlan.target_end_date, CarePlan.actual_end_date,
+    CarePlan.last_reviewed_date, CarePlan.next_review_date, CarePlan.status,
+    CarePlan.primary_nurse_id, CarePlan.physician_name, CarePlan.physician_phone,
+    CarePlan.clinical_summary, CarePlan.discharge_plan,
+    CarePlan.created_at, CarePlan.updated_at,
+)
+
+
+def _parse_datetime(value):
+    """Parse an ISO-8601 timestamp from a request body; None if missing."""
+    return parse_datetime(value) if value else None
+
+
+def _parse_date(value):
+    """Parse an ISO-8601 date (or timestamp) from a request body; None if missing."""
+    return parse_datetime(value).date() if value else None
+
+
+def _page_args():
+    """Read ?limit= and ?after= from the request; ValueError on a malformed cursor."""
+    limit = min(max(request.args.get('limit', DEFAULT_PAGE_SIZE, type=int), 1), MAX_PAGE_SIZE)
+    after = request.args.get('after')
+    if not after:
+        return limit, None
+    
+    # Cursors are "<timestamp>,<id>" of the last row on the previous page
+    timestamp, _, row_id = after.rpartition(',')
+    return limit, (parse_datetime(timestamp), int(row_id))
+
+
+def _keyset_page(query, ts_col, id_col, limit, after):
+    """
+    Run query newest-first, starting just past the after cursor.
+    
+    Returns (rows as dicts, next_cursor); next_cursor is None on the last page.
+    The id tiebreak keeps rows that share a timestamp from being skipped.
+    """
+    if after:
+        query = query.where(tuple_(ts_col, id_col) < after)
+    
+    rows = db.session.execute(
+        query.order_by(ts_col.desc(), id_col.desc()).limit(limit + 1)
+    ).mappings().all()
+    
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = f'{rows[-1][ts_col.key].isoformat()},{rows[-1][id_col.key]}'
+    return [dict(row) for row in rows], next_cursor
+
+
+def _care_plan_patient_id(care_plan_id, facility_id):
+    """patient_id of the care plan if it belongs to facility_id, else None."""
+    def load_owner():
+        row = db.session.execute(
+            select(CarePlan.facility_id, CarePlan.patient_id).where(CarePlan.id == care_plan_id)
+        ).first()
+        return list(row) if row else None
+    
+    # A plan's facility and patient never change, so child writes can
+    # authorize against the cached pair. A miss isn't cached: the plan may be
+    # committing right now, and a cached null would 404 its children.
+    owner = cache_get_or_set(
+        care_plan_owner_key(care_plan_id),
+        load_owner,
+        timeout=current_app.config['CARE_PLAN_OWNER_CACHE_TTL'],
+        cache_none=False
+    )
+    if not owner or owner[0] != facility_id:
+        return None
+    return owner[1]
+
+
+def _insert_row(model, **values):
+    """INSERT one row with Core and return it as a dict, skipping the ORM flush and refresh."""
+    table = model.__table__
+    stmt = insert(table).values(**values).returning(*table.c)
+    return dict(db.session.execute(stmt).mappings().one())
+
+
+def _new_care_plan(data, user):
+    """Build a CarePlan from a create request body."""
+    return CarePlan(
+        patient_id=data['patient_id'],
+        facility_id=user.facility_id,
+        plan_name=data['plan_name'],
+        plan_type=data.get('plan_type'),
+        primary_diagnosis=data.get('primary_diagnosis'),
+        care_goals=data.get('care_goals'),
+        start_date=_parse_date(data['start_date']),
+        target_end_date=_parse_date(data.get('target_end_date')),
+        primary_nurse_id=data.get('primary_nurse_id', user.id),
+        physician_name=data.get('physician_name'),
+        physician_phone=data.get('physician_phone'),
+        clinical_summary=data.get('clinical_summary'),
+        created_by_user_id=user.id,
+        status='active',
+        next_review_date=cast(_DB_NOW, Date) + 30
+    )
+
+
+def _new_intervention(data, user, care_plan_id, patient_id):
+    """Build a NursingIntervention from a create request body."""
+    return NursingIntervention(
+        care_plan_id=care_plan_id,
+        patient_id=patient_id,
+        intervention_type=data['intervention_type'],
+        intervention_name=data['intervention_name'],
+        description=data['description'],
+        rationale=data.get('rationale'),
+        frequency=data.get('frequency'),
+        frequency_times_per_day=data.get('frequency_times_per_day'),
+        scheduled_times=data.get('scheduled_times'),
+        prn_indication=data.get('prn_indication'),
+        start_date=_parse_date(data['start_date']),
+        end_date=_parse_date(data.get('end_date')),
+        assigned_role=data.get('assigned_role'),
+        assigned_user_id=data.get('assigned_user_id'),
+        requires_rn=data.get('requires_rn', False),
+        priority=data.get('priority', 'routine'),
+        expected_outcome=data.get('expected_outcome'),
+        created_by_user_id=user.id
+    )
+
+
+def _new_order(data, user, care_plan_id, patient_id):
+    """Build a PhysicianOrder from a create request body."""
+    return PhysicianOrder(
+        care_plan_id=care_plan_id,
+        patient_id=patient_id,
+        order_type=data['order_type'],
+        order_category=data.get('order_category'),
+        order_text=data['order_text'],
+        ordering_physician=data['ordering_physician'],
+        physician_npi=data.get('physician_npi'),
+        physician_phone=data.get('physician_phone'),
+        order_date=_parse_datetime(data['order_date']),
+        start_date=_parse_date(data['start_date']),
+        end_date=_parse_date(data.get('end_date')),
+        frequency=data.get('frequency'),
+        duration=data.get('duration'),
+        prn_indication=data.get('prn_indication'),
+        priority=data.get('priority', 'routine'),
+        special_instructions=data.get('special_instructions'),
+        created_by_user_id=user.id
+    )
+
+
+def _new_task(data, user, care_plan_id, patient_id):
+    """Build an AssistanceTask from a create request body."""
+    return AssistanceTask(
+        care_plan_id=care_plan_id,
+        patient_id=patient_id,
+        task_category=data['task_category'],
+        task_name=data['task_name'],
+        description=data['description'],
+        adl_type=data.get('adl_type'),
+        assistance_level=data.get('assistance_level'),
+        frequency=data['frequency'],
+        frequency_times_per_day=data.get('frequency_times_per_day'),
+        scheduled_times=data.get('scheduled_times'),
+        estimated_duration_minutes=data.get('estimated_duration_minutes'),
+        start_date=_parse_date(data['start_date']),
+        end_date=_parse_date(data.get('end_date')),
+        assigned_role=data['assigned_role'],
+        assigned_user_id=data.get('assigned_user_id'),
+        requires_two_person_assist=data.get('requires_two_person_assist', False),
+        priority=data.get('priority', 'routine'),
+        equipment_needed=data.get('equipment_needed'),
+        safety_precautions=data.get('safety_precautions'),
+        fall_risk_precautions=data.get('fall_risk_precautions', False),
+        patient_preferences=data.get('patient_preferences'),
+        created_by_user_id=user.id
+    )
+
 
 @bp.route('', methods=['GET'])
 @jwt_required()
 def get_care_plans():
     """Get care plans with optional filtering."""
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    user = get_token_user()
     
     try:
         patient_id = request.args.get('patient_id', type=int)
         status = request.args.get('status')
-        
-        query = CarePlan.query.filter_by(facility_id=user.facility_id)
-        
-        if patient_id:
-            query = query.filter_by(patient_id=patient_id)
-        
-        if status:
-            query = query.filter_by(status=status)
-        
-        care_plans = query.order_by(CarePlan.created_at.desc()).all()
-        
-        return jsonify({
-            'status': 'success',
-            'data': [cp.to_dict() for cp in care_plans]
-        }), 200
-        
+        limit, after = _page_args()
+        
+        def load_page():
+            query = select(*CARE_PLAN_LIST_COLS).where(CarePlan.facility_id == user.facility_id)
+            if patient_id:
+                query = query.where(CarePlan.patient_id == patient_id)
+            if status:
+                query = query.where(CarePlan.status == status)
+            care_plans, next_cursor = _keyset_page(query, CarePlan.created_at, CarePlan.id, limit, after)
+            return {'data': care_plans, 'next_cursor': next_cursor}
+        
+        # Dashboards re-request the newest page of the same view; cache that page
+        # until a care plan in the scope changes
+        if after or limit != DEFAULT_PAGE_SIZE:
+            page = load_page()
+        else:
+            page = cache_get_or_set_versioned(
+                care_plans_key(user.facility_id, patient_id, status),
+                load_page,
+                timeout=current_app.config['CARE_PLANS_CACHE_TTL']
+            )
+        
+        return jsonify({'status': 'success', **page}), 200
+        
+    except ValueError:
+        return jsonify({'status': 'error', 'message': 'Invalid pagination cursor'}), 400
     except Exception as e:
-        app_logger.error(f"Error getting care plans: {str(e)}")
+        app_logger.error("Error getting care plans: %s", e)
         return jsonify({'status': 'error', 'message': 'Failed to get care plans'}), 500
 
 
@@ -48,11 +254,17 @@ def get_care_plans():
 @jwt_required()
 def get_care_plan(care_plan_id):
     """Get a single care plan with related items."""
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    user = get_token_user()
     
     try:
-        care_plan = CarePlan.query.filter_by(
+        # Related items arrive in one IN-batched query per collection; to_dict()
+        # reads columns only, so any other relationship access raises
+        care_plan = CarePlan.query.options(
+            selectinload(CarePlan.nursing_interventions),
+            selectinload(CarePlan.physician_orders),
+            selectinload(CarePlan.assistance_tasks),
+            raiseload('*')
+        ).filter_by(
             id=care_plan_id,
             facility_id=user.facility_id
         ).first()
@@ -60,23 +272,18 @@ def get_care_plan(care_plan_id):
         if not care_plan:
             return jsonify({'status': 'error', 'message': 'Care plan not found'}), 404
         
-        # Get related items
-        interventions = NursingIntervention.query.filter_by(care_plan_id=care_plan_id).all()
-        orders = PhysicianOrder.query.filter_by(care_plan_id=care_plan_id).all()
-        tasks = AssistanceTask.query.filter_by(care_plan_id=care_plan_id).all()
-        
         return jsonify({
             'status': 'success',
             'data': {
                 'care_plan': care_plan.to_dict(),
-                'interventions': [i.to_dict() for i in interventions],
-                'orders': [o.to_dict() for o in orders],
-                'tasks': [t.to_dict() for t in tasks]
+                'interventions': [i.to_dict() for i in care_plan.nursing_interventions],
+                'orders': [o.to_dict() for o in care_plan.physician_orders],
+                'tasks': [t.to_dict() for t in care_plan.assistance_tasks]
             }
         }), 200
         
     except Exception as e:
-        app_logger.error(f"Error getting care plan {care_plan_id}: {str(e)}")
+        app_logger.error("Error getting care plan %s: %s", care_plan_id, e)
         return jsonify({'status': 'error', 'message': 'Failed to get care plan'}), 500
 
 
@@ -84,12 +291,11 @@ def get_care_plan(care_plan_id):
 @jwt_required()
 def create_care_plan():
     """Create a new care plan."""
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    user = get_token_user()
     
     try:
         # Check permission
-        if user.role not in ['RN', 'Admin']:
+        if user.role not in _RN_ADMIN_ROLES:
             return jsonify({'status': 'error', 'message': 'Only RNs and Admins can create care plans'}), 403
         
         data = request.json
@@ -104,28 +310,12 @@ def create_care_plan():
             return jsonify({'status': 'error', 'message': 'Patient not found'}), 404
         
         # Create care plan
-        care_plan = CarePlan(
-            patient_id=data['patient_id'],
-            facility_id=user.facility_id,
-            plan_name=data['plan_name'],
-            plan_type=data.get('plan_type'),
-            primary_diagnosis=data.get('primary_diagnosis'),
-            care_goals=data.get('care_goals'),
-            start_date=datetime.fromisoformat(data['start_date']).date(),
-            target_end_date=datetime.fromisoformat(data['target_end_date']).date() if data.get('target_end_date') else None,
-            primary_nurse_id=data.get('primary_nurse_id', user.id),
-            physician_name=data.get('physician_name'),
-            physician_phone=data.get('physician_phone'),
-            clinical_summary=data.get('clinical_summary'),
-            created_by_user_id=user.id,
-            status='active',
-            next_review_date=(datetime.utcnow() + timedelta(days=30)).date()
-        )
+        care_plan = _new_care_plan(data, user)
         
         db.session.add(care_plan)
         db.session.commit()
         
-        app_logger.info(f"Care plan {care_plan.id} created by user {user.id} for patient {patient.id}")
+        app_logger.info("Care plan %s created by user %s for patient %s", care_plan.id, user.id, patient.id)
         
         return jsonify({
             'status': 'success',
@@ -135,7 +325,73 @@ def create_care_plan():
         
     except Exception as e:
         db.session.rollback()
-        app_logger.error(f"Error creating care plan: {str(e)}")
+        app_logger.error("Error creating care plan: %s", e)
+        return jsonify({'status': 'error', 'message': 'Failed to create care plan'}), 500
+
+
+@bp.route('/bulk', methods=['POST'])
+@jwt_required()
+def create_care_plan_bulk():
+    """
+    Create a care plan together with its initial interventions, orders and tasks.
+    
+    Body: {"care_plan": {...}, "interventions": [...], "orders": [...], "tasks": [...]},
+    each item shaped like the matching single-create endpoint. Everything is
+    written in one transaction, so an admission is all-or-nothing and costs
+    one commit instead of one per item.
+    """
+    user = get_token_user()
+    
+    try:
+        if user.role not in _RN_ADMIN_ROLES:
+            return jsonify({'status': 'error', 'message': 'Only RNs and Admins can create care plans'}), 403
+        
+        data = request.json
+        plan_data = data['care_plan']
+        
+        patient = Patient.query.filter_by(
+            id=plan_data['patient_id'],
+            facility_id=user.facility_id
+        ).first()
+        
+        if not patient:
+            return jsonify({'status': 'error', 'message': 'Patient not found'}), 404
+        
+        care_plan = _new_care_plan(plan_data, user)
+        db.session.add(care_plan)
+        db.session.flush()  # assigns care_plan.id for the children
+        
+        owner = (user, care_plan.id, care_plan.patient_id)
+        interventions = [_new_intervention(d, *owner) for d in data.get('interventions', [])]
+        orders = [_new_order(d, *owner) for d in data.get('orders', [])]
+        tasks = [_new_task(d, *owner) for d in data.get('tasks', [])]
+        db.session.add_all([*interventions, *orders, *tasks])
+        db.session.flush()
+        
+        # Serialize before committing so the commit doesn't expire every row
+        result = {
+            'care_plan': care_plan.to_dict(),
+            'interventions': [i.to_dict() for i in interventions],
+            'orders': [o.to_dict() for o in orders],
+            'tasks': [t.to_dict() for t in tasks]
+        }
+        db.session.commit()
+        
+        app_logger.info(
+            "Care plan %s created by user %s for patient %s with %s interventions, %s orders, %s tasks",
+            result['care_plan']['id'], user.id, plan_data['patient_id'],
+            len(interventions), len(orders), len(tasks)
+        )
+        
+        return jsonify({
+            'status': 'success',
+            'message': 'Care plan created',
+            'data': result
+        }), 201
+        
+    except Exception as e:
+        db.session.rollback()
+        app_logger.error("Error creating care plan in bulk: %s", e)
         return jsonify({'status': 'error', 'message': 'Failed to create care plan'}), 500
 
 
@@ -143,11 +399,10 @@ def create_care_plan():
 @jwt_required()
 def update_care_plan(care_plan_id):
     """Update a care plan."""
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    user = get_token_user()
     
     try:
-        if user.role not in ['RN', 'Admin']:
+        if user.role not in _RN_ADMIN_ROLES:
             return jsonify({'status': 'error', 'message': 'Only RNs and Admins can update care plans'}), 403
         
         care_plan = CarePlan.query.filter_by(
@@ -161,25 +416,17 @@ def update_care_plan(care_plan_id):
         data = request.json
         
         # Update allowed fields
-        if 'plan_name' in data:
-            care_plan.plan_name = data['plan_name']
-        if 'plan_type' in data:
-            care_plan.plan_type = data['plan_type']
-        if 'care_goals' in data:
-            care_plan.care_goals = data['care_goals']
-        if 'clinical_summary' in data:
-            care_plan.clinical_summary = data['clinical_summary']
-        if 'discharge_plan' in data:
-            care_plan.discharge_plan = data['discharge_plan']
+        for field in _CARE_PLAN_UPDATABLE & data.keys():
+            setattr(care_plan, field, data[field])
         if 'status' in data:
             care_plan.status = data['status']
             if data['status'] == 'completed':
-                care_plan.actual_end_date = datetime.utcnow().date()
+                care_plan.actual_end_date = cast(_DB_NOW, Date)
         
-        care_plan.updated_at = datetime.utcnow()
+        care_plan.updated_at = _DB_NOW
         db.session.commit()
         
-        app_logger.info(f"Care plan {care_plan_id} updated by user {user.id}")
+        app_logger.info("Care plan %s updated by user %s", care_plan_id, user.id)
         
         return jsonify({
             'status': 'success',
@@ -189,7 +436,7 @@ def update_care_plan(care_plan_id):
         
     except Exception as e:
         db.session.rollback()
-        app_logger.error(f"Error updating care plan {care_plan_id}: {str(e)}")
+        app_logger.error("Error updating care plan %s: %s", care_plan_id, e)
         return jsonify({'status': 'error', 'message': 'Failed to update care plan'}), 500
 
 
@@ -198,48 +445,24 @@ def update_care_plan(care_plan_id):
 @jwt_required()
 def create_intervention(care_plan_id):
     """Add a nursing intervention to a care plan."""
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    user = get_token_user()
     
     try:
-        if user.role not in ['RN', 'LPN', 'Admin']:
+        if user.role not in _NURSE_ROLES:
             return jsonify({'status': 'error', 'message': 'Only nurses can create interventions'}), 403
         
-        care_plan = CarePlan.query.filter_by(
-            id=care_plan_id,
-            facility_id=user.facility_id
-        ).first()
-        
-        if not care_plan:
+        patient_id = _care_plan_patient_id(care_plan_id, user.facility_id)
+        if patient_id is None:
             return jsonify({'status': 'error', 'message': 'Care plan not found'}), 404
         
         data = request.json
         
-        intervention = NursingIntervention(
-            care_plan_id=care_plan_id,
-            patient_id=care_plan.patient_id,
-            intervention_type=data['intervention_type'],
-            intervention_name=data['intervention_name'],
-            description=data['description'],
-            rationale=data.get('rationale'),
-            frequency=data.get('frequency'),
-            frequency_times_per_day=data.get('frequency_times_per_day'),
-            scheduled_times=data.get('scheduled_times'),
-            prn_indication=data.get('prn_indication'),
-            start_date=datetime.fromisoformat(data['start_date']).date(),
-            end_date=datetime.fromisoformat(data['end_date']).date() if data.get('end_date') else None,
-            assigned_role=data.get('assigned_role'),
-            assigned_user_id=data.get('assigned_user_id'),
-            requires_rn=data.get('requires_rn', False),
-            priority=data.get('priority', 'routine'),
-            expected_outcome=data.get('expected_outcome'),
-            created_by_user_id=user.id
-        )
+        intervention = _new_intervention(data, user, care_plan_id, patient_id)
         
         db.session.add(intervention)
         db.session.commit()
         
-        app_logger.info(f"Intervention {intervention.id} created for care plan {care_plan_id} by user {user.id}")
+        app_logger.info("Intervention %s created for care plan %s by user %s", intervention.id, care_plan_id, user.id)
         
         return jsonify({
             'status': 'success',
@@ -249,7 +472,7 @@ def create_intervention(care_plan_id):
         
     except Exception as e:
         db.session.rollback()
-        app_logger.error(f"Error creating intervention: {str(e)}")
+        app_logger.error("Error creating intervention: %s", e)
         return jsonify({'status': 'error', 'message': 'Failed to create intervention'}), 500
 
 
@@ -257,11 +480,10 @@ def create_intervention(care_plan_id):
 @jwt_required()
 def update_intervention(intervention_id):
     """Update a nursing intervention."""
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    user = get_token_user()
     
     try:
-        if user.role not in ['RN', 'LPN', 'Admin']:
+        if user.role not in _NURSE_ROLES:
             return jsonify({'status': 'error', 'message': 'Only nurses can update interventions'}), 403
         
         intervention = NursingIntervention.query.get(intervention_id)
@@ -273,19 +495,17 @@ def update_intervention(intervention_id):
         if 'status' in data:
             intervention.status = data['status']
             if data['status'] == 'discontinued':
-                intervention.discontinued_at = datetime.utcnow()
+                intervention.discontinued_at = _DB_NOW
                 intervention.discontinued_by_user_id = user.id
                 intervention.discontinued_reason = data.get('discontinued_reason')
         
-        if 'frequency' in data:
-            intervention.frequency = data['frequency']
-        if 'assigned_user_id' in data:
-            intervention.assigned_user_id = data['assigned_user_id']
+        for field in _INTERVENTION_UPDATABLE & data.keys():
+            setattr(intervention, field, data[field])
         
-        intervention.updated_at = datetime.utcnow()
+        intervention.updated_at = _DB_NOW
         db.session.commit()
         
-        app_logger.info(f"Intervention {intervention_id} updated by user {user.id}")
+        app_logger.info("Intervention %s updated by user %s", intervention_id, user.id)
         
         return jsonify({
             'status': 'success',
@@ -295,7 +515,7 @@ def update_intervention(intervention_id):
         
     except Exception as e:
         db.session.rollback()
-        app_logger.error(f"Error updating intervention: {str(e)}")
+        app_logger.error("Error updating intervention: %s", e)
         return jsonify({'status': 'error', 'message': 'Failed to update intervention'}), 500
 
 
@@ -303,8 +523,7 @@ def update_intervention(intervention_id):
 @jwt_required()
 def complete_intervention(intervention_id):
     """Document completion of a nursing intervention."""
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    user = get_token_user()
     
     try:
         intervention = NursingIntervention.query.get(intervention_id)
@@ -312,18 +531,19 @@ def complete_intervention(intervention_id):
             return jsonify({'status': 'error', 'message': 'Intervention not found'}), 404
         
         # Check permissions
-        if intervention.requires_rn and user.role not in ['RN', 'Admin']:
+        if intervention.requires_rn and user.role not in _RN_ADMIN_ROLES:
             return jsonify({'status': 'error', 'message': 'This intervention requires an RN'}), 403
         
-        if user.role not in ['RN', 'LPN', 'Admin']:
+        if user.role not in _NURSE_ROLES:
             return jsonify({'status': 'error', 'message': 'Only licensed nurses can complete interventions'}), 403
         
         data = request.json
         
-        completion = InterventionCompletion(
+        completion = _insert_row(
+            InterventionCompletion,
             intervention_id=intervention_id,
             patient_id=intervention.patient_id,
-            completed_at=datetime.fromisoformat(data['completed_at']) if data.get('completed_at') else datetime.utcnow(),
+            completed_at=_parse_datetime(data.get('completed_at')) or _DB_NOW,
             completed_by_user_id=user.id,
             status=data['status'],
             completion_notes=data['completion_notes'],
@@ -336,20 +556,19 @@ def complete_intervention(intervention_id):
             follow_up_notes=data.get('follow_up_notes')
         )
         
-        db.session.add(completion)
         db.session.commit()
         
-        app_logger.info(f"Intervention {intervention_id} completed by user {user.id}: {data['status']}")
+        app_logger.info("Intervention %s completed by user %s: %s", intervention_id, user.id, data['status'])
         
         return jsonify({
             'status': 'success',
             'message': 'Intervention completion documented',
-            'data': completion.to_dict()
+            'data': completion
         }), 201
         
     except Exception as e:
         db.session.rollback()
-        app_logger.error(f"Error completing intervention: {str(e)}")
+        app_logger.error("Error completing intervention: %s", e)
         return jsonify({'status': 'error', 'message': 'Failed to document completion'}), 500
 
 
@@ -358,47 +577,24 @@ def complete_intervention(intervention_id):
 @jwt_required()
 def create_order(care_plan_id):
     """Add a physician order to a care plan."""
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    user = get_token_user()
     
     try:
-        if user.role not in ['RN', 'LPN', 'Admin']:
+        if user.role not in _NURSE_ROLES:
             return jsonify({'status': 'error', 'message': 'Only nurses can enter physician orders'}), 403
         
-        care_plan = CarePlan.query.filter_by(
-            id=care_plan_id,
-            facility_id=user.facility_id
-        ).first()
-        
-        if not care_plan:
+        patient_id = _care_plan_patient_id(care_plan_id, user.facility_id)
+        if patient_id is None:
             return jsonify({'status': 'error', 'message': 'Care plan not found'}), 404
         
         data = request.json
         
-        order = PhysicianOrder(
-            care_plan_id=care_plan_id,
-            patient_id=care_plan.patient_id,
-            order_type=data['order_type'],
-            order_category=data.get('order_category'),
-            order_text=data['order_text'],
-            ordering_physician=data['ordering_physician'],
-            physician_npi=data.get('physician_npi'),
-            physician_phone=data.get('physician_phone'),
-            order_date=datetime.fromisoformat(data['order_date']),
-            start_date=datetime.fromisoformat(data['start_date']).date(),
-            end_date=datetime.fromisoformat(data['end_date']).date() if data.get('end_date') else None,
-            frequency=data.get('frequency'),
-            duration=data.get('duration'),
-            prn_indication=data.get('prn_indication'),
-            priority=data.get('priority', 'routine'),
-            special_instructions=data.get('special_instructions'),
-            created_by_user_id=user.id
-        )
+        order = _new_order(data, user, care_plan_id, patient_id)
         
         db.session.add(order)
         db.session.commit()
         
-        app_logger.info(f"Physician order {order.id} created for care plan {care_plan_id} by user {user.id}")
+        app_logger.info("Physician order %s created for care plan %s by user %s", order.id, care_plan_id, user.id)
         
         return jsonify({
             'status': 'success',
@@ -408,7 +604,7 @@ def create_order(care_plan_id):
         
     except Exception as e:
         db.session.rollback()
-        app_logger.error(f"Error creating physician order: {str(e)}")
+        app_logger.error("Error creating physician order: %s", e)
         return jsonify({'status': 'error', 'message': 'Failed to create order'}), 500
 
 
@@ -416,11 +612,10 @@ def create_order(care_plan_id):
 @jwt_required()
 def verify_order(order_id):
     """Verify a physician order."""
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    user = get_token_user()
     
     try:
-        if user.role not in ['RN', 'LPN', 'Admin']:
+        if user.role not in _NURSE_ROLES:
             return jsonify({'status': 'error', 'message': 'Only licensed nurses can verify orders'}), 403
         
         order = PhysicianOrder.query.get(order_id)
@@ -431,14 +626,14 @@ def verify_order(order_id):
         
         order.verification_status = data.get('verification_status', 'verified')
         order.verified_by_user_id = user.id
-        order.verified_at = datetime.utcnow()
+        order.verified_at = _DB_NOW
         
         if order.verification_status == 'verified':
             order.status = 'active'
         
         db.session.commit()
         
-        app_logger.info(f"Order {order_id} verified by user {user.id}: {order.verification_status}")
+        app_logger.info("Order %s verified by user %s: %s", order_id, user.id, order.verification_status)
         
         return jsonify({
             'status': 'success',
@@ -448,7 +643,7 @@ def verify_order(order_id):
         
     except Exception as e:
         db.session.rollback()
-        app_logger.error(f"Error verifying order: {str(e)}")
+        app_logger.error("Error verifying order: %s", e)
         return jsonify({'status': 'error', 'message': 'Failed to verify order'}), 500
 
 
@@ -456,8 +651,7 @@ def verify_order(order_id):
 @jwt_required()
 def complete_order(order_id):
     """Document completion of a physician order."""
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    user = get_token_user()
     
     try:
         order = PhysicianOrder.query.get(order_id)
@@ -466,10 +660,11 @@ def complete_order(order_id):
         
         data = request.json
         
-        completion = OrderCompletion(
+        completion = _insert_row(
+            OrderCompletion,
             order_id=order_id,
             patient_id=order.patient_id,
-            completed_at=datetime.fromisoformat(data['completed_at']) if data.get('completed_at') else datetime.utcnow(),
+            completed_at=_parse_datetime(data.get('completed_at')) or _DB_NOW,
             completed_by_user_id=user.id,
             status=data['status'],
             completion_notes=data['completion_notes'],
@@ -481,20 +676,19 @@ def complete_order(order_id):
             notification_notes=data.get('notification_notes')
         )
         
-        db.session.add(completion)
         db.session.commit()
         
-        app_logger.info(f"Order {order_id} completed by user {user.id}: {data['status']}")
+        app_logger.info("Order %s completed by user %s: %s", order_id, user.id, data['status'])
         
         return jsonify({
             'status': 'success',
             'message': 'Order completion documented',
-            'data': completion.to_dict()
+            'data': completion
         }), 201
         
     except Exception as e:
         db.session.rollback()
-        app_logger.error(f"Error completing order: {str(e)}")
+        app_logger.error("Error completing order: %s", e)
         return jsonify({'status': 'error', 'message': 'Failed to document completion'}), 500
 
 
@@ -503,52 +697,24 @@ def complete_order(order_id):
 @jwt_required()
 def create_task(care_plan_id):
     """Add an assistance task to a care plan."""
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    user = get_token_user()
     
     try:
-        if user.role not in ['RN', 'LPN', 'Admin']:
+        if user.role not in _NURSE_ROLES:
             return jsonify({'status': 'error', 'message': 'Only nurses can create tasks'}), 403
         
-        care_plan = CarePlan.query.filter_by(
-            id=care_plan_id,
-            facility_id=user.facility_id
-        ).first()
-        
-        if not care_plan:
+        patient_id = _care_plan_patient_id(care_plan_id, user.facility_id)
+        if patient_id is None:
             return jsonify({'status': 'error', 'message': 'Care plan not found'}), 404
         
         data = request.json
         
-        task = AssistanceTask(
-            care_plan_id=care_plan_id,
-            patient_id=care_plan.patient_id,
-            task_category=data['task_category'],
-            task_name=data['task_name'],
-            description=data['description'],
-            adl_type=data.get('adl_type'),
-            assistance_level=data.get('assistance_level'),
-            frequency=data['frequency'],
-            frequency_times_per_day=data.get('frequency_times_per_day'),
-            scheduled_times=data.get('scheduled_times'),
-            estimated_duration_minutes=data.get('estimated_duration_minutes'),
-            start_date=datetime.fromisoformat(data['start_date']).date(),
-            end_date=datetime.fromisoformat(data['end_date']).date() if data.get('end_date') else None,
-            assigned_role=data['assigned_role'],
-            assigned_user_id=data.get('assigned_user_id'),
-            requires_two_person_assist=data.get('requires_two_person_assist', False),
-            priority=data.get('priority', 'routine'),
-            equipment_needed=data.get('equipment_needed'),
-            safety_precautions=data.get('safety_precautions'),
-            fall_risk_precautions=data.get('fall_risk_precautions', False),
-            patient_preferences=data.get('patient_preferences'),
-            created_by_user_id=user.id
-        )
+        task = _new_task(data, user, care_plan_id, patient_id)
         
         db.session.add(task)
         db.session.commit()
         
-        app_logger.info(f"Task {task.id} created for care plan {care_plan_id} by user {user.id}")
+        app_logger.info("Task %s created for care plan %s by user %s", task.id, care_plan_id, user.id)
         
         return jsonify({
             'status': 'success',
@@ -558,7 +724,7 @@ def create_task(care_plan_id):
         
     except Exception as e:
         db.session.rollback()
-        app_logger.error(f"Error creating task: {str(e)}")
+        app_logger.error("Error creating task: %s", e)
         return jsonify({'status': 'error', 'message': 'Failed to create task'}), 500
 
 
@@ -566,8 +732,7 @@ def create_task(care_plan_id):
 @jwt_required()
 def complete_task(task_id):
     """Document completion of an assistance task."""
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    user = get_token_user()
     
     try:
         task = AssistanceTask.query.get(task_id)
@@ -575,15 +740,16 @@ def complete_task(task_id):
             return jsonify({'status': 'error', 'message': 'Task not found'}), 404
         
         # Check if user's role matches task assignment
-        if task.assigned_role and user.role != task.assigned_role and user.role not in ['RN', 'Admin']:
+        if task.assigned_role and user.role != task.assigned_role and user.role not in _RN_ADMIN_ROLES:
             return jsonify({'status': 'error', 'message': f'This task is assigned to {task.assigned_role}'}), 403
         
         data = request.json
         
-        completion = TaskCompletion(
+        completion = _insert_row(
+            TaskCompletion,
             task_id=task_id,
             patient_id=task.patient_id,
-            completed_at=datetime.fromisoformat(data['completed_at']) if data.get('completed_at') else datetime.utcnow(),
+            completed_at=_parse_datetime(data.get('completed_at')) or _DB_NOW,
             completed_by_user_id=user.id,
             assisted_by_user_id=data.get('assisted_by_user_id'),
             status=data['status'],
@@ -596,20 +762,19 @@ def complete_task(task_id):
             duration_minutes=data.get('duration_minutes')
         )
         
-        db.session.add(completion)
         db.session.commit()
         
-        app_logger.info(f"Task {task_id} completed by user {user.id}: {data['status']}")
+        app_logger.info("Task %s completed by user %s: %s", task_id, user.id, data['status'])
         
         return jsonify({
             'status': 'success',
             'message': 'Task completion documented',
-            'data': completion.to_dict()
+            'data': completion
         }), 201
         
     except Exception as e:
         db.session.rollback()
-        app_logger.error(f"Error completing task: {str(e)}")
+        app_logger.error("Error completing task: %s", e)
         return jsonify({'status': 'error', 'message': 'Failed to document completion'}), 500
 
 
@@ -619,17 +784,24 @@ def complete_task(task_id):
 def get_intervention_completions(intervention_id):
     """Get completion history for an intervention."""
     try:
-        completions = InterventionCompletion.query.filter_by(
-            intervention_id=intervention_id
-        ).order_by(InterventionCompletion.completed_at.desc()).all()
+        limit, after = _page_args()
+        
+        # to_dict() covers every column, so the rows serialize as-is
+        query = select(*InterventionCompletion.__table__.c).where(InterventionCompletion.intervention_id == intervention_id)
+        completions, next_cursor = _keyset_page(
+            query, InterventionCompletion.completed_at, InterventionCompletion.id, limit, after
+        )
         
         return jsonify({
             'status': 'success',
-            'data': [c.to_dict() for c in completions]
+            'data': completions,
+            'next_cursor': next_cursor
         }), 200
         
+    except ValueError:
+        return jsonify({'status': 'error', 'message': 'Invalid pagination cursor'}), 400
     except Exception as e:
-        app_logger.error(f"Error getting intervention completions: {str(e)}")
+        app_logger.error("Error getting intervention completions: %s", e)
         return jsonify({'status': 'error', 'message': 'Failed to get completions'}), 500
 
 
@@ -638,17 +810,24 @@ def get_intervention_completions(intervention_id):
 def get_task_completions(task_id):
     """Get completion history for a task."""
     try:
-        completions = TaskCompletion.query.filter_by(
-            task_id=task_id
-        ).order_by(TaskCompletion.completed_at.desc()).all()
+        limit, after = _page_args()
+        
+        # to_dict() covers every column, so the rows serialize as-is
+        query = select(*TaskCompletion.__table__.c).where(TaskCompletion.task_id == task_id)
+        completions, next_cursor = _keyset_page(
+            query, TaskCompletion.completed_at, TaskCompletion.id, limit, after
+        )
         
         return jsonify({
             'status': 'success',
-            'data': [c.to_dict() for c in completions]
+            'data': completions,
+            'next_cursor': next_cursor
         }), 200
         
+    except ValueError:
+        return jsonify({'status': 'error', 'message': 'Invalid pagination cursor'}), 400
     except Exception as e:
-        app_logger.error(f"Error getting task completions: {str(e)}")
+        app_logger.error("Error getting task completions: %s", e)
         return jsonify({'status': 'error', 'message': 'Failed to get completions'}), 500
 
 
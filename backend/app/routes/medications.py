@@ -418,8 +418,8 @@ def administer_medication(medication_id):
         administration = MedicationAdministration(
             medication_id=medication_id,
             administered_by=current_user_id,
-            scheduled_time=datetime.fromisoformat(data['scheduled_time'].replace('Z', '+00:00')),
-            actual_time=datetime.fromisoformat(data['actual_time'].replace('Z', '+00:00')),
+            scheduled_time=datetime.fromisoformat(data['scheduled_time']),
+            actual_time=datetime.fromisoformat(data['actual_time']),
             status=data['status'],
             dose_given=data.get('dose_given', medication.dose),
             not_given_reason=data.get('not_given_reason'),
@@ -517,7 +517,7 @@ def reassess_prn_effectiveness(admin_id):
         
         if data.get('prn_reassessment_time'):
             administration.prn_reassessment_time = datetime.fromisoformat(
-                data['prn_reassessment_time'].replace('Z', '+00:00')
+                data['prn_reassessment_time']
             )
         else:
             administration.prn_reassessment_time = datetime.utcnow()
@@ -82,7 +82,10 @@ def create_user():
         employee_id=data.get('employee_id'),
         department=data.get('department')
     )
-    user.set_password(data['password'])
+    try:
+        user.set_password(data['password'])
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
     db.session.add(user)
     db.session.commit()
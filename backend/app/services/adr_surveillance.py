@@ -539,7 +539,7 @@ class ADRSurveillanceService:
         
         Updates status and records who acknowledged it.
         """
-        alert = ADRAlert.query.get(alert_id)
+        alert = db.session.get(ADRAlert, alert_id)
         if not alert:
             return None
         
@@ -548,7 +548,7 @@ class ADRSurveillanceService:
         alert.acknowledged_at = datetime.utcnow()
         
         if notes:
-            alert.investigation_notes = notes
+            ADRAlert.append_investigation_note(alert_id, user_id=user_id, event='ACKNOWLEDGED', note=notes)
         
         db.session.commit()
         return alert
@@ -560,7 +560,7 @@ class ADRSurveillanceService:
         
         Links alert to formal pharmacist review process.
         """
-        alert = ADRAlert.query.get(alert_id)
+        alert = db.session.get(ADRAlert, alert_id)
         if not alert or alert.pharmacist_consulted:
             return None
         
@@ -592,7 +592,7 @@ class ADRSurveillanceService:
         """
         Resolve an ADR alert with outcome documentation.
         """
-        alert = ADRAlert.query.get(alert_id)
+        alert = db.session.get(ADRAlert, alert_id)
         if not alert:
             return None
         
@@ -0,0 +1,6 @@
+"""Background tasks package."""
+from app.tasks.adr import analyze_observation_task
+from app.tasks.audit import write_audit_entries_task
+from app.tasks.notifications import send_provider_notification_task
+
+__all__ = ['analyze_observation_task', 'write_audit_entries_task', 'send_provider_notification_task']
@@ -0,0 +1,10 @@
+"""ADR surveillance background tasks."""
+from celery import shared_task
+from app.services.adr_surveillance import ADRSurveillanceService
+
+
+@shared_task
+def analyze_observation_task(observation_id):
+    """Run ADR surveillance for an observation. Returns generated alert IDs."""
+    alerts = ADRSurveillanceService.analyze_observation(observation_id)
+    return [alert.id for alert in alerts]
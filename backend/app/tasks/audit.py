@@ -0,0 +1,12 @@
+"""Audit log background tasks."""
+from celery import shared_task
+from sqlalchemy.exc import OperationalError
+from app import db
+from app.models import AuditLog
+
+
+@shared_task(autoretry_for=(OperationalError,), retry_backoff=True, max_retries=5)
+def write_audit_entries_task(entries):
+    """Insert audit entries buffered by a request that never committed."""
+    AuditLog.write_entries(entries)
+    db.session.commit()
@@ -0,0 +1,25 @@
+"""Provider notification delivery tasks (routed to the 'notifications' queue)."""
+from celery import shared_task
+from flask import current_app
+from app import db
+from app.models import ADRAlert
+
+
+@shared_task(autoretry_for=(ConnectionError, TimeoutError), retry_backoff=True, max_retries=5)
+def send_provider_notification_task(alert_id, notification):
+    """
+    Deliver a provider notification for an ADR alert.
+    
+    No outbound channel (SMS/email/pager) is wired up yet; delivery is logged.
+    Network failures from a channel are retried with exponential backoff.
+    """
+    alert = db.session.get(ADRAlert, alert_id)
+    if alert is None:
+        return False
+    
+    current_app.logger.info(
+        'Provider notification | Alert #%s | Urgency: %s | Method: %s | Provider: %s',
+        alert.id, alert.provider_notification_urgency,
+        notification.get('method'), notification.get('provider_name')
+    )
+    return True
@@ -1,4 +1,4 @@
 """Utility functions package."""
-from app.utils.permissions import require_role
+from app.utils.permissions import require_role, get_current_user, get_token_user, user_claims
 
-__all__ = ['require_role']
+__all__ = ['require_role', 'get_current_user', 'get_token_user', 'user_claims']
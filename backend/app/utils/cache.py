@@ -0,0 +1,185 @@
+"""Small Redis-backed cache for hot, short-lived lookups.
+
+Caching is disabled (every call goes to the factory) when REDIS_URL is not
+configured, so development works without Redis.
+"""
+import time
+import orjson
+from flask import current_app, has_app_context
+from redis import Redis, RedisError
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.utils.json_provider import dumps_bytes
+
+
+# Generations only need to outlive the entries cached under them
+GENERATION_TTL = 24 * 60 * 60
+
+
+def cache_init_app(app):
+    """Attach a Redis client to the app when REDIS_URL is set."""
+    url = app.config.get('REDIS_URL')
+    app.extensions['redis'] = Redis.from_url(url) if url else None
+
+
+def _client():
+    if not has_app_context():
+        return None
+    return current_app.extensions.get('redis')
+
+
+def active_meds_key(patient_id):
+    return f'meds:active:{patient_id}'
+
+
+def active_alerts_key(facility_id, patient_id):
+    return f'adr:active:{facility_id}:{patient_id}'
+
+
+def care_plan_owner_key(care_plan_id):
+    return f'care_plans:owner:{care_plan_id}'
+
+
+def care_plans_key(facility_id, patient_id=None, status=None):
+    return f'care_plans:{facility_id}:{patient_id or "all"}:{status or "all"}'
+
+
+def current_user_key(user_id):
+    return f'auth:me:{user_id}'
+
+
+def login_attempts_key(ip, username):
+    return f'auth:attempts:{ip}:{username}'
+
+
+def cache_get_or_set(key, factory, timeout, cache_none=True):
+    """
+    Return the cached JSON value for key, computing and storing it on a miss.
+    
+    Pass cache_none=False when a None result means "not there yet" (a row
+    that may be inserted any moment) rather than a stable answer.
+    """
+    client = _client()
+    if client is None:
+        return factory()
+    
+    try:
+        cached = client.get(key)
+        if cached is not None:
+            return orjson.loads(cached)
+    except RedisError as e:
+        current_app.logger.warning('Cache read failed for %s: %s', key, e)
+        return factory()
+    
+    value = factory()
+    if value is None and not cache_none:
+        return value
+    try:
+        client.set(key, dumps_bytes(value), ex=timeout)
+    except RedisError as e:
+        current_app.logger.warning('Cache write failed for %s: %s', key, e)
+    return value
+
+
+def _generation(key):
+    """
+    Current generation of a versioned key, or None if Redis is unavailable.
+    
+    A missing generation is seeded from the clock, so one lost to expiry or
+    eviction never restarts at a number an older live entry was cached under.
+    """
+    client = _client()
+    if client is None:
+        return None
+    
+    gen_key = f'{key}:gen'
+    try:
+        _, generation = client.pipeline().set(
+            gen_key, time.time_ns(), nx=True, ex=GENERATION_TTL
+        ).get(gen_key).execute()
+    except RedisError as e:
+        current_app.logger.warning('Cache generation read failed for %s: %s', key, e)
+        return None
+    return int(generation)
+
+
+def cache_get_or_set_versioned(key, factory, timeout):
+    """
+    cache_get_or_set under the key's current generation (see bump_on_commit).
+    
+    A reader that loaded its value before a write committed stores it under
+    the old generation, which nobody reads again, so the race between a
+    read-then-set and an invalidation can't reinstate stale data.
+    """
+    generation = _generation(key)
+    if generation is None:
+        return factory()
+    return cache_get_or_set(f'{key}:{generation}', factory, timeout)
+
+
+def cache_incr(key, timeout):
+    """Increment a counter and restart its TTL; None if Redis is unavailable."""
+    client = _client()
+    if client is None:
+        return None
+    
+    try:
+        count, _ = client.pipeline().incr(key).expire(key, timeout).execute()
+    except RedisError as e:
+        current_app.logger.warning('Cache increment failed for %s: %s', key, e)
+        return None
+    return count
+
+
+def cache_delete(*keys):
+    """Invalidate keys; failures are logged, stale entries expire via TTL."""
+    client = _client()
+    if client is None or not keys:
+        return
+    
+    try:
+        client.delete(*keys)
+    except RedisError as e:
+        current_app.logger.warning('Cache delete failed for %s: %s', keys, e)
+
+
+def invalidate_on_commit(session, *keys):
+    """Delete keys once the session's transaction commits; dropped on rollback."""
+    session.info.setdefault('cache_invalidations', set()).update(keys)
+
+
+def bump_on_commit(session, *keys):
+    """Advance the generation of versioned keys once the transaction commits."""
+    session.info.setdefault('cache_generation_bumps', set()).update(keys)
+
+
+def _bump_generations(keys):
+    client = _client()
+    if client is None:
+        return
+    
+    try:
+        pipe = client.pipeline()
+        for key in keys:
+            gen_key = f'{key}:gen'
+            pipe.set(gen_key, time.time_ns(), nx=True).incr(gen_key).expire(gen_key, GENERATION_TTL)
+        pipe.execute()
+    except RedisError as e:
+        current_app.logger.warning('Cache generation bump failed for %s: %s', keys, e)
+
+
+@event.listens_for(Session, 'after_commit')
+def _delete_invalidated_keys(session):
+    keys = session.info.pop('cache_invalidations', None)
+    if keys:
+        cache_delete(*keys)
+    
+    bumps = session.info.pop('cache_generation_bumps', None)
+    if bumps:
+        _bump_generations(bumps)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_invalidated_keys(session):
+    session.info.pop('cache_invalidations', None)
+    session.info.pop('cache_generation_bumps', None)
@@ -0,0 +1,68 @@
+"""orjson-backed JSON serialization for API responses and JSON columns."""
+from decimal import Decimal
+from flask.json.provider import JSONProvider
+import orjson
+
+# Naive datetimes are emitted without an offset, matching datetime.isoformat()
+# so the wire format the frontend parses does not change.
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    """Serialize types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def dumps_bytes(obj):
+    """Serialize to JSON bytes."""
+    return orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS)
+
+
+def dumps(obj):
+    """Serialize to a JSON string (used for SQLAlchemy JSON columns)."""
+    return dumps_bytes(obj).decode('utf-8')
+
+
+def stream_json(batches, **envelope):
+    """
+    Yield {"status": "success", "data": [...], "count": N, **envelope} in chunks.
+    
+    batches is an iterable of lists of serializable items; one chunk is encoded
+    per batch, so memory is bounded by the batch rather than the result set.
+    """
+    yield b'{"status":"success","data":['
+    count = 0
+    for batch in batches:
+        if not batch:
+            continue
+        chunk = b','.join(dumps_bytes(item) for item in batch)
+        yield (b',' + chunk) if count else chunk
+        count += len(batch)
+    # Reuse the encoder for the trailer, dropping its opening brace
+    yield b'],' + dumps_bytes({'count': count, **envelope})[1:]
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider that encodes with orjson.
+
+    Models can return native datetime/date/Decimal values from to_dict()
+    and let the encoder format them instead of calling isoformat()/float().
+    """
+
+    mimetype = 'application/json'
+
+    def dumps(self, obj, **kwargs):
+        return dumps(obj)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_bytes(obj), mimetype=self.mimetype)
@@ -0,0 +1,67 @@
+"""Prometheus metrics, including database connection pool usage."""
+import time
+from flask import has_request_context, request
+from prometheus_client import (
+    CollectorRegistry, GCCollector, Histogram, PlatformCollector, ProcessCollector
+)
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_flask_exporter import PrometheusMetrics
+from sqlalchemy import event
+
+CONNECTION_HOLD_SECONDS = Histogram(
+    'db_connection_hold_seconds',
+    'Time a pooled DB connection stayed checked out, by endpoint',
+    ['endpoint'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+    registry=None  # registered into each app's registry in metrics_init_app
+)
+
+
+class PoolCollector:
+    """Snapshot QueuePool size, checked-out and overflow counts on each scrape."""
+    
+    def __init__(self, engine):
+        self._engine = engine
+    
+    def collect(self):
+        pool = self._engine.pool
+        yield GaugeMetricFamily('db_pool_size', 'Configured pool size', value=pool.size())
+        yield GaugeMetricFamily('db_pool_checked_out', 'Connections currently checked out', value=pool.checkedout())
+        yield GaugeMetricFamily('db_pool_overflow', 'Connections open beyond pool_size', value=pool.overflow())
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    # Sessions are closed at app-context teardown, after the request context
+    # is gone, so capture the endpoint label now
+    endpoint = (request.endpoint or 'unknown') if has_request_context() else 'background'
+    connection_record.info['checkout'] = (time.monotonic(), endpoint)
+
+
+def _on_checkin(dbapi_connection, connection_record):
+    checkout = connection_record.info.pop('checkout', None)
+    if checkout:
+        started, endpoint = checkout
+        CONNECTION_HOLD_SECONDS.labels(endpoint=endpoint).observe(time.monotonic() - started)
+
+
+def metrics_init_app(app, db):
+    """
+    Expose /metrics and instrument the app's engine pool.
+    
+    Each app gets its own CollectorRegistry: the process-global REGISTRY
+    rejects a second registration of the same metric names, which a second
+    create_app() in one process (tests, CLI, preloading servers) would make.
+    """
+    registry = CollectorRegistry(auto_describe=True)
+    ProcessCollector(registry=registry)
+    PlatformCollector(registry=registry)
+    GCCollector(registry=registry)
+    registry.register(CONNECTION_HOLD_SECONDS)
+    
+    PrometheusMetrics(app, registry=registry, group_by='endpoint')
+    
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'checkout', _on_checkout)
+    event.listen(engine, 'checkin', _on_checkin)
+    registry.register(PoolCollector(engine))
@@ -1,10 +1,53 @@
 """Permission decorators for route access control."""
 from functools import wraps
-from flask import jsonify
-from flask_jwt_extended import get_jwt_identity
+from typing import NamedTuple
+from flask import g, jsonify
+from flask_jwt_extended import get_jwt, get_jwt_identity
+from app import db
 from app.models import User
 
 
+class TokenUser(NamedTuple):
+    """Identity fields carried in the access token's claims."""
+    id: int
+    facility_id: int
+    role: str
+    username: str
+
+
+_CLAIM_FIELDS = TokenUser._fields[1:]
+
+
+def user_claims(user):
+    """Additional JWT claims embedded at login so routes can skip the User lookup."""
+    return {field: getattr(user, field) for field in _CLAIM_FIELDS}
+
+
+def get_current_user():
+    """Full User row for the JWT identity, loaded at most once per request."""
+    if 'current_user' not in g:
+        g.current_user = db.session.get(User, get_jwt_identity())
+    return g.current_user
+
+
+def get_token_user():
+    """
+    Return the current user's id, facility_id, role and username from the JWT.
+    
+    Tokens issued before these claims existed fall back to a User lookup.
+    Returns None if the user no longer exists.
+    """
+    user_id = get_jwt_identity()
+    claims = get_jwt()
+    if all(field in claims for field in _CLAIM_FIELDS):
+        return TokenUser(user_id, *(claims[field] for field in _CLAIM_FIELDS))
+    
+    user = get_current_user()
+    if not user:
+        return None
+    return TokenUser(user.id, user.facility_id, user.role, user.username)
+
+
 def require_role(roles):
     """
     Decorator to restrict route access based on user role.
@@ -25,8 +68,7 @@ def require_role(roles):
     def decorator(fn):
         @wraps(fn)
         def wrapper(*args, **kwargs):
-            current_user_id = get_jwt_identity()
-            user = User.query.get(current_user_id)
+            user = get_token_user()
             
             if not user:
                 return jsonify({'error': 'User not found'}), 404
@@ -0,0 +1,13 @@
+"""Celery worker entry point.
+
+Usage:
+    celery -A celery_worker.celery_app worker -Q adr,audit,notifications --loglevel=info
+
+Every task is routed to one of these queues, so a worker started without -Q
+consumes none of them. Run one worker per queue to scale them separately
+(see README.md).
+"""
+from app import create_app
+
+app = create_app()
+celery_app = app.extensions['celery']
@@ -20,6 +20,16 @@ class Config:
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = False
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 20)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 30)),
+        'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', 10)),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 1800)),
+        'pool_pre_ping': True,
+        # psycopg2: executemany UPDATE/DELETE via execute_batch (INSERTs already
+        # use multi-row VALUES)
+        'executemany_mode': 'values_plus_batch',
+    }
     
     # JWT
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'jwt-secret-key-change-in-production')
@@ -33,6 +43,10 @@ class Config:
     # Security
     SESSION_TIMEOUT = int(os.getenv('SESSION_TIMEOUT', 1800))
     PASSWORD_MIN_LENGTH = int(os.getenv('PASSWORD_MIN_LENGTH', 12))
+    BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS', 12))  # bcrypt work factor, 4-31
+    # Login attempts allowed per (IP, username) within LOGIN_RATE_WINDOW seconds (needs REDIS_URL)
+    LOGIN_RATE_LIMIT = int(os.getenv('LOGIN_RATE_LIMIT', 20))
+    LOGIN_RATE_WINDOW = int(os.getenv('LOGIN_RATE_WINDOW', 60))
     REQUIRE_STRONG_PASSWORDS = os.getenv('REQUIRE_STRONG_PASSWORDS', 'true').lower() == 'true'
     
     # CORS
@@ -43,6 +57,29 @@ class Config:
     UPLOAD_FOLDER = os.getenv('UPLOAD_FOLDER', 'uploads')
     ALLOWED_EXTENSIONS = {'jpg', 'jpeg', 'png', 'pdf'}
     
+    # Background tasks (Celery). Without a broker, tasks run inline in the
+    # request so development works without Redis.
+    CELERY = {
+        'broker_url': os.getenv('CELERY_BROKER_URL'),
+        'task_always_eager': not os.getenv('CELERY_BROKER_URL'),
+        'task_ignore_result': True,
+        'task_eager_propagates': True,
+        # Slow external deliveries get their own workers so they can't starve ADR analysis
+        'task_routes': {
+            'app.tasks.adr.*': {'queue': 'adr'},
+            'app.tasks.audit.*': {'queue': 'audit'},
+            'app.tasks.notifications.*': {'queue': 'notifications'},
+        },
+    }
+    
+    # Redis cache for hot lookups (disabled when unset)
+    REDIS_URL = os.getenv('REDIS_URL')
+    ACTIVE_MEDS_CACHE_TTL = int(os.getenv('ACTIVE_MEDS_CACHE_TTL', 60))
+    ACTIVE_ALERTS_CACHE_TTL = int(os.getenv('ACTIVE_ALERTS_CACHE_TTL', 60))
+    CURRENT_USER_CACHE_TTL = int(os.getenv('CURRENT_USER_CACHE_TTL', 300))
+    CARE_PLANS_CACHE_TTL = int(os.getenv('CARE_PLANS_CACHE_TTL', 30))
+    CARE_PLAN_OWNER_CACHE_TTL = int(os.getenv('CARE_PLAN_OWNER_CACHE_TTL', 300))
+    
     # Logging
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     LOG_FILE = os.getenv('LOG_FILE', 'logs/app.log')
@@ -76,6 +113,7 @@ class TestingConfig(Config):
     """Testing configuration."""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'postgresql://localhost/homecare_ehr_test'
+    BCRYPT_ROUNDS = 4
     WTF_CSRF_ENABLED = False
 
 
@@ -0,0 +1,26 @@
+"""Index adr_alerts.observation_id
+
+Revision ID: 0a6d4e2c8b17
+Revises: f7c3b1d95e28
+Create Date: 2026-10-16 12:48:06.915374
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0a6d4e2c8b17'
+down_revision = 'f7c3b1d95e28'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(op.f('ix_adr_alerts_observation_id'), 'adr_alerts', ['observation_id'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(op.f('ix_adr_alerts_observation_id'), table_name='adr_alerts', postgresql_concurrently=True)
@@ -0,0 +1,53 @@
+"""Store adr_alerts.investigation_notes as a JSONB array of entries
+
+Revision ID: 1c8e5f3a9d60
+Revises: 0a6d4e2c8b17
+Create Date: 2026-10-16 13:21:40.558213
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '1c8e5f3a9d60'
+down_revision = '0a6d4e2c8b17'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('adr_alerts', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('investigation_notes_json', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    
+    # Existing free-text notes become one {"note": ...} entry per line
+    op.execute("""
+        UPDATE adr_alerts SET investigation_notes_json = (
+            SELECT coalesce(jsonb_agg(jsonb_build_object('note', line)), '[]'::jsonb)
+            FROM regexp_split_to_table(investigation_notes, E'\\n') AS line
+            WHERE btrim(line) <> ''
+        )
+        WHERE investigation_notes IS NOT NULL
+    """)
+    
+    with op.batch_alter_table('adr_alerts', schema=None) as batch_op:
+        batch_op.drop_column('investigation_notes')
+        batch_op.alter_column('investigation_notes_json', new_column_name='investigation_notes')
+
+
+def downgrade():
+    with op.batch_alter_table('adr_alerts', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('investigation_notes_text', sa.Text(), nullable=True))
+    
+    op.execute("""
+        UPDATE adr_alerts SET investigation_notes_text = (
+            SELECT string_agg(coalesce(entry->>'note', entry::text), E'\\n')
+            FROM jsonb_array_elements(investigation_notes) AS entry
+        )
+        WHERE investigation_notes IS NOT NULL
+    """)
+    
+    with op.batch_alter_table('adr_alerts', schema=None) as batch_op:
+        batch_op.drop_column('investigation_notes')
+        batch_op.alter_column('investigation_notes_text', new_column_name='investigation_notes')
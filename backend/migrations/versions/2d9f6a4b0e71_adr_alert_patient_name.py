@@ -0,0 +1,65 @@
+"""Denormalize patient_name onto adr_alerts with sync triggers
+
+Revision ID: 2d9f6a4b0e71
+Revises: 1c8e5f3a9d60
+Create Date: 2026-10-16 13:58:12.403771
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2d9f6a4b0e71'
+down_revision = '1c8e5f3a9d60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('adr_alerts', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('patient_name', sa.String(length=201), nullable=True))
+    
+    op.execute("""
+        UPDATE adr_alerts a SET patient_name = p.first_name || ' ' || p.last_name
+        FROM patients p WHERE p.id = a.patient_id
+    """)
+    
+    op.execute("""
+        CREATE OR REPLACE FUNCTION adr_alerts_set_patient_name() RETURNS trigger AS $$
+        BEGIN
+            SELECT first_name || ' ' || last_name INTO NEW.patient_name
+            FROM patients WHERE id = NEW.patient_id;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER adr_alerts_set_patient_name
+            BEFORE INSERT OR UPDATE OF patient_id ON adr_alerts
+            FOR EACH ROW EXECUTE FUNCTION adr_alerts_set_patient_name()
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION patients_sync_adr_alert_name() RETURNS trigger AS $$
+        BEGIN
+            UPDATE adr_alerts SET patient_name = NEW.first_name || ' ' || NEW.last_name
+            WHERE patient_id = NEW.id AND resolved_at IS NULL;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER patients_sync_adr_alert_name
+            AFTER UPDATE OF first_name, last_name ON patients
+            FOR EACH ROW EXECUTE FUNCTION patients_sync_adr_alert_name()
+    """)
+
+
+def downgrade():
+    op.execute('DROP TRIGGER IF EXISTS patients_sync_adr_alert_name ON patients')
+    op.execute('DROP FUNCTION IF EXISTS patients_sync_adr_alert_name()')
+    op.execute('DROP TRIGGER IF EXISTS adr_alerts_set_patient_name ON adr_alerts')
+    op.execute('DROP FUNCTION IF EXISTS adr_alerts_set_patient_name()')
+    
+    with op.batch_alter_table('adr_alerts', schema=None) as batch_op:
+        batch_op.drop_column('patient_name')
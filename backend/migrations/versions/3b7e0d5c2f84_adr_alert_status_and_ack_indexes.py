@@ -0,0 +1,31 @@
+"""Widen ADR alert listing index with status; index acknowledgment lookups
+
+Revision ID: 3b7e0d5c2f84
+Revises: 2d9f6a4b0e71
+Create Date: 2026-10-16 15:07:33.184026
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b7e0d5c2f84'
+down_revision = '2d9f6a4b0e71'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index('ix_adr_alerts_fac_created_status', 'adr_alerts', ['facility_id', sa.text('created_at DESC'), 'status'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_adr_alerts_fac_created', table_name='adr_alerts', postgresql_concurrently=True)
+        op.create_index('ix_ack_alert_user_ackat', 'adr_alert_acknowledgments', ['alert_id', 'user_id', sa.text('acknowledged_at DESC')], unique=False, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_ack_alert_user_ackat', table_name='adr_alert_acknowledgments', postgresql_concurrently=True)
+        op.create_index('ix_adr_alerts_fac_created', 'adr_alerts', ['facility_id', sa.text('created_at DESC')], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_adr_alerts_fac_created_status', table_name='adr_alerts', postgresql_concurrently=True)
@@ -0,0 +1,47 @@
+"""Add cached to_dict snapshot to adr_alerts with invalidation trigger
+
+Revision ID: 4c1f8a6d3e95
+Revises: 3b7e0d5c2f84
+Create Date: 2026-10-16 16:21:47.530918
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '4c1f8a6d3e95'
+down_revision = '3b7e0d5c2f84'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('adr_alerts', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('cached_repr', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    
+    # Snapshots are filled lazily by the dashboard; existing rows start empty
+    op.execute("""
+        CREATE OR REPLACE FUNCTION adr_alerts_clear_cached_repr() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.cached_repr IS NOT DISTINCT FROM OLD.cached_repr THEN
+                NEW.cached_repr := NULL;
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER adr_alerts_clear_cached_repr
+            BEFORE UPDATE ON adr_alerts
+            FOR EACH ROW EXECUTE FUNCTION adr_alerts_clear_cached_repr()
+    """)
+
+
+def downgrade():
+    op.execute('DROP TRIGGER IF EXISTS adr_alerts_clear_cached_repr ON adr_alerts')
+    op.execute('DROP FUNCTION IF EXISTS adr_alerts_clear_cached_repr()')
+    
+    with op.batch_alter_table('adr_alerts', schema=None) as batch_op:
+        batch_op.drop_column('cached_repr')
@@ -0,0 +1,37 @@
+"""Store wound tissue_type_percentages as JSONB
+
+Revision ID: 5b1c9e7a3d42
+Revises: 2ffe5d3fee03
+Create Date: 2026-10-16 09:12:31.402118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '5b1c9e7a3d42'
+down_revision = '2ffe5d3fee03'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('wound_assessments', schema=None) as batch_op:
+        batch_op.alter_column('tissue_type_percentages',
+               existing_type=sa.Text(),
+               type_=postgresql.JSONB(astext_type=sa.Text()),
+               existing_nullable=True,
+               postgresql_using='tissue_type_percentages::jsonb')
+        batch_op.create_index('ix_wound_tissue_gin', ['tissue_type_percentages'], unique=False, postgresql_using='gin')
+
+
+def downgrade():
+    with op.batch_alter_table('wound_assessments', schema=None) as batch_op:
+        batch_op.drop_index('ix_wound_tissue_gin', postgresql_using='gin')
+        batch_op.alter_column('tissue_type_percentages',
+               existing_type=postgresql.JSONB(astext_type=sa.Text()),
+               type_=sa.Text(),
+               existing_nullable=True,
+               postgresql_using='tissue_type_percentages::text')
@@ -0,0 +1,29 @@
+"""Add BRIN indexes on ADR alert and observation timestamps
+
+Revision ID: 5d2a9c7e4b18
+Revises: 4c1f8a6d3e95
+Create Date: 2026-10-16 16:48:09.271354
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2a9c7e4b18'
+down_revision = '4c1f8a6d3e95'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index('ix_adr_alerts_created_brin', 'adr_alerts', ['created_at'], unique=False, postgresql_using='brin', postgresql_with={'pages_per_range': 32}, postgresql_concurrently=True)
+        op.create_index('ix_observations_obsdt_brin', 'patient_observations', ['observation_datetime'], unique=False, postgresql_using='brin', postgresql_with={'pages_per_range': 32}, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_observations_obsdt_brin', table_name='patient_observations', postgresql_concurrently=True)
+        op.drop_index('ix_adr_alerts_created_brin', table_name='adr_alerts', postgresql_concurrently=True)
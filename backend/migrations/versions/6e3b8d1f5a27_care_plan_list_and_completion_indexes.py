@@ -0,0 +1,33 @@
+"""Add composite indexes for care plan lists and completion history
+
+Revision ID: 6e3b8d1f5a27
+Revises: 5d2a9c7e4b18
+Create Date: 2026-10-16 17:32:41.608419
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6e3b8d1f5a27'
+down_revision = '5d2a9c7e4b18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index('ix_care_plans_fac_created', 'care_plans', ['facility_id', sa.text('created_at DESC')], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_care_plans_patient_created', 'care_plans', ['patient_id', sa.text('created_at DESC')], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_intervention_completions_int_completed', 'intervention_completions', ['intervention_id', sa.text('completed_at DESC')], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_task_completions_task_completed', 'task_completions', ['task_id', sa.text('completed_at DESC')], unique=False, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_task_completions_task_completed', table_name='task_completions', postgresql_concurrently=True)
+        op.drop_index('ix_intervention_completions_int_completed', table_name='intervention_completions', postgresql_concurrently=True)
+        op.drop_index('ix_care_plans_patient_created', table_name='care_plans', postgresql_concurrently=True)
+        op.drop_index('ix_care_plans_fac_created', table_name='care_plans', postgresql_concurrently=True)
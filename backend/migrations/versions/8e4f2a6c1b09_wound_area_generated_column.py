@@ -0,0 +1,26 @@
+"""Add generated area_cm2 column to wound assessments
+
+Revision ID: 8e4f2a6c1b09
+Revises: 5b1c9e7a3d42
+Create Date: 2026-10-16 09:40:05.118734
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e4f2a6c1b09'
+down_revision = '5b1c9e7a3d42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('wound_assessments', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('area_cm2', sa.Numeric(precision=10, scale=4), sa.Computed('length_cm * width_cm', persisted=True), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('wound_assessments', schema=None) as batch_op:
+        batch_op.drop_column('area_cm2')
@@ -0,0 +1,31 @@
+"""Add composite indexes on users and wound assessments
+
+Revision ID: c3a7d5e90f16
+Revises: 8e4f2a6c1b09
+Create Date: 2026-10-16 10:05:47.553201
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3a7d5e90f16'
+down_revision = '8e4f2a6c1b09'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index('ix_users_fac_active', 'users', ['facility_id', 'is_active'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_users_fac_role', 'users', ['facility_id', 'role'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_wound_patient_date', 'wound_assessments', ['patient_id', sa.text('assessment_date DESC')], unique=False, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_wound_patient_date', table_name='wound_assessments', postgresql_concurrently=True)
+        op.drop_index('ix_users_fac_role', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_users_fac_active', table_name='users', postgresql_concurrently=True)
@@ -0,0 +1,29 @@
+"""Add generated full_name column with trigram index to users
+
+Revision ID: d91b0c4e7a23
+Revises: c3a7d5e90f16
+Create Date: 2026-10-16 11:02:19.874530
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd91b0c4e7a23'
+down_revision = 'c3a7d5e90f16'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('full_name', sa.String(length=201), sa.Computed("first_name || ' ' || last_name", persisted=True), nullable=True))
+        batch_op.create_index('ix_users_fullname_trgm', ['full_name'], unique=False, postgresql_using='gin', postgresql_ops={'full_name': 'gin_trgm_ops'})
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index('ix_users_fullname_trgm', postgresql_using='gin', postgresql_ops={'full_name': 'gin_trgm_ops'})
+        batch_op.drop_column('full_name')
@@ -0,0 +1,29 @@
+"""Add composite indexes on ADR alerts and patient observations
+
+Revision ID: e5a2f8c71d34
+Revises: d91b0c4e7a23
+Create Date: 2026-10-16 11:42:18.207645
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a2f8c71d34'
+down_revision = 'd91b0c4e7a23'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index('ix_adr_alerts_fac_created', 'adr_alerts', ['facility_id', sa.text('created_at DESC')], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_observations_patient_obsdt', 'patient_observations', ['patient_id', sa.text('observation_datetime DESC')], unique=False, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_observations_patient_obsdt', table_name='patient_observations', postgresql_concurrently=True)
+        op.drop_index('ix_adr_alerts_fac_created', table_name='adr_alerts', postgresql_concurrently=True)
@@ -0,0 +1,33 @@
+"""Add generated urgency_rank column with index to adr_alerts
+
+Revision ID: f7c3b1d95e28
+Revises: e5a2f8c71d34
+Create Date: 2026-10-16 12:14:51.630942
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f7c3b1d95e28'
+down_revision = 'e5a2f8c71d34'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Generated column is computed for existing rows when added
+    with op.batch_alter_table('adr_alerts', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('urgency_rank', sa.SmallInteger(), sa.Computed("CASE provider_notification_urgency WHEN 'STAT' THEN 1 WHEN 'URGENT' THEN 2 WHEN 'ROUTINE' THEN 3 ELSE 4 END", persisted=True), nullable=True))
+    
+    with op.get_context().autocommit_block():
+        op.create_index('ix_adr_alerts_fac_urgency', 'adr_alerts', ['facility_id', 'urgency_rank', sa.text('created_at DESC')], unique=False, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_adr_alerts_fac_urgency', table_name='adr_alerts', postgresql_concurrently=True)
+    
+    with op.batch_alter_table('adr_alerts', schema=None) as batch_op:
+        batch_op.drop_column('urgency_rank')
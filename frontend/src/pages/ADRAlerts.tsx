@@ -37,11 +37,16 @@ import { adrApi } from '../services/api'
 import { useAuthStore } from '../store/authStore'
 import type { ADRAlert } from '../types'
 
+const ALERTS_PAGE_SIZE = 50
+
 export default function ADRAlerts() {
   const navigate = useNavigate()
   const { user } = useAuthStore()
   const [alerts, setAlerts] = useState<ADRAlert[]>([])
+  const [total, setTotal] = useState(0)
+  const [page, setPage] = useState(1)
   const [loading, setLoading] = useState(true)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [error, setError] = useState('')
   const [selectedAlert, setSelectedAlert] = useState<ADRAlert | null>(null)
   const [acknowledgeNote, setAcknowledgeNote] = useState('')
@@ -51,20 +56,28 @@ export default function ADRAlerts() {
     loadAlerts()
   }, [statusFilter])
 
-  const loadAlerts = async () => {
+  // The API returns one page at a time; later pages are appended by "Load more"
+  const loadAlerts = async (nextPage = 1) => {
     try {
-      setLoading(true)
+      if (nextPage === 1) setLoading(true)
+      else setLoadingMore(true)
       setError('')
       const params = statusFilter === 'all' ? {} : { status: statusFilter }
-      const response = await adrApi.getActiveAlerts(params)
-      const alertData = response.data?.data || response.data || []
-      setAlerts(Array.isArray(alertData) ? alertData : [])
+      const response = await adrApi.getActiveAlerts({ ...params, page: nextPage, per_page: ALERTS_PAGE_SIZE })
+      const alertData = Array.isArray(response.data?.data) ? response.data.data : []
+      setAlerts(prev => nextPage === 1 ? alertData : [...prev, ...alertData])
+      setTotal(response.data?.total ?? alertData.length)
+      setPage(nextPage)
     } catch (err: any) {
       console.error('ADR Alert Error:', err)
       setError(err.response?.data?.message || 'Failed to load ADR alerts')
-      setAlerts([])
+      if (nextPage === 1) {
+        setAlerts([])
+        setTotal(0)
+      }
     } finally {
       setLoading(false)
+      setLoadingMore(false)
     }
   }
 
@@ -357,6 +370,17 @@ export default function ADRAlerts() {
         </Grid>
       )}
 
+      {alerts.length < total && (
+        <Box sx={{ display: 'flex', alignItems: 'center', justifyContent: 'center', gap: 2, mt: 3 }}>
+          <Typography variant="body2" color="text.secondary">
+            Showing {alerts.length} of {total} alerts
+          </Typography>
+          <Button variant="outlined" onClick={() => loadAlerts(page + 1)} disabled={loadingMore}>
+            {loadingMore ? <CircularProgress size={20} /> : 'Load more'}
+          </Button>
+        </Box>
+      )}
+
       {/* Alert Detail Dialog */}
       <Dialog 
         open={!!selectedAlert} 
@@ -35,7 +35,9 @@ export default function CarePlanOverview() {
   const navigate = useNavigate()
   const { user } = useAuthStore()
   const [carePlans, setCarePlans] = useState<CarePlan[]>([])
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
   const [loading, setLoading] = useState(true)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [error, setError] = useState('')
   const [searchQuery, setSearchQuery] = useState('')
   const [statusFilter, setStatusFilter] = useState<string>('active')
@@ -44,18 +46,24 @@ export default function CarePlanOverview() {
     loadCarePlans()
   }, [statusFilter])
 
-  const loadCarePlans = async () => {
+  // The API returns one page at a time; pass the cursor back to append the next
+  const loadCarePlans = async (after?: string) => {
     try {
-      setLoading(true)
+      if (after) setLoadingMore(true)
+      else setLoading(true)
       setError('')
       const response = await carePlansApi.getAll({ 
-        status: statusFilter === 'all' ? undefined : statusFilter 
+        status: statusFilter === 'all' ? undefined : statusFilter,
+        after,
       })
-      setCarePlans(response.data.data || [])
+      const plans = response.data.data || []
+      setCarePlans(prev => after ? [...prev, ...plans] : plans)
+      setNextCursor(response.data.next_cursor ?? null)
     } catch (err: any) {
       setError(err.response?.data?.message || 'Failed to load care plans')
     } finally {
       setLoading(false)
+      setLoadingMore(false)
     }
   }
 
@@ -267,6 +275,19 @@ export default function CarePlanOverview() {
                 ))}
               </Grid>
             )}
+
+            {nextCursor && (
+              <Box sx={{ display: 'flex', alignItems: 'center', justifyContent: 'center', gap: 2, mt: 3 }}>
+                <Typography variant="body2" color="text.secondary">
+                  {searchQuery
+                    ? `Searching the ${carePlans.length} care plans loaded so far`
+                    : `Showing ${carePlans.length} care plans`}
+                </Typography>
+                <Button variant="outlined" onClick={() => loadCarePlans(nextCursor)} disabled={loadingMore}>
+                  {loadingMore ? <CircularProgress size={20} /> : 'Load more'}
+                </Button>
+              </Box>
+            )}
           </>
         )}
       </Box>
@@ -25,6 +25,7 @@ export default function Dashboard() {
   const navigate = useNavigate()
   const { user } = useAuthStore()
   const [adrAlerts, setAdrAlerts] = useState<ADRAlert[]>([])
+  const [alertTotal, setAlertTotal] = useState(0)
   const [loadingAlerts, setLoadingAlerts] = useState(true)
 
   useEffect(() => {
@@ -34,12 +35,15 @@ export default function Dashboard() {
   const loadADRAlerts = async () => {
     try {
       setLoadingAlerts(true)
-      const response = await adrApi.getActiveAlerts({ status: 'NEW' })
-      const alerts = response.data?.data || response.data || []
+      // Only the first few alerts are shown; the headline count comes from total
+      const response = await adrApi.getActiveAlerts({ status: 'NEW', per_page: 3 })
+      const alerts = response.data?.data || []
       setAdrAlerts(Array.isArray(alerts) ? alerts : [])
+      setAlertTotal(response.data?.total ?? alerts.length)
     } catch (err) {
       console.error('Failed to load ADR alerts:', err)
       setAdrAlerts([]) // Set empty array on error
+      setAlertTotal(0)
     } finally {
       setLoadingAlerts(false)
     }
@@ -75,7 +79,7 @@ export default function Dashboard() {
             </Box>
           </CardContent>
         </Card>
-      ) : adrAlerts.length > 0 && (
+      ) : alertTotal > 0 && (
         <Alert 
           severity="error" 
           icon={<ErrorIcon />}
@@ -92,7 +96,7 @@ export default function Dashboard() {
           }
         >
           <Typography variant="subtitle2" gutterBottom>
-            <strong>{adrAlerts.length} Unacknowledged ADR Alert{adrAlerts.length !== 1 ? 's' : ''} Requiring Attention</strong>
+            <strong>{alertTotal} Unacknowledged ADR Alert{alertTotal !== 1 ? 's' : ''} Requiring Attention</strong>
           </Typography>
           {adrAlerts.slice(0, 3).map((alert) => (
             <Box key={alert.id} sx={{ mt: 1, mb: 1 }}>
@@ -107,9 +111,9 @@ export default function Dashboard() {
               </Typography>
             </Box>
           ))}
-          {adrAlerts.length > 3 && (
+          {alertTotal > 3 && (
             <Typography variant="caption" color="text.secondary">
-              ...and {adrAlerts.length - 3} more alert{adrAlerts.length - 3 !== 1 ? 's' : ''}
+              ...and {alertTotal - 3} more alert{alertTotal - 3 !== 1 ? 's' : ''}
             </Typography>
           )}
         </Alert>
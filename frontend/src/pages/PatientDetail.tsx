@@ -66,6 +66,7 @@ export default function PatientDetail() {
   const [medications, setMedications] = useState<Medication[]>([])
   const [visits, setVisits] = useState<Visit[]>([])
   const [alerts, setAlerts] = useState<ADRAlert[]>([])
+  const [alertTotal, setAlertTotal] = useState(0)
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState('')
   const [tabValue, setTabValue] = useState(0)
@@ -219,7 +220,7 @@ export default function PatientDetail() {
       const [patientRes, medsRes, alertsRes] = await Promise.all([
         patientsApi.getById(patientId),
         medicationsApi.getByPatient(patientId),
-        adrApi.getActiveAlerts({ patient_id: patientId }),
+        adrApi.getActiveAlerts({ patient_id: patientId, per_page: 200 }),
       ])
 
       console.log('✅ PatientDetail: Raw patient response:', patientRes)
@@ -241,9 +242,11 @@ export default function PatientDetail() {
       console.log('💊 PatientDetail: Setting medications:', medsData)
       setMedications(medsData)
       
-      const alertsData = alertsRes.data.data || alertsRes.data || []
+      const alertsData = alertsRes.data.data || []
       console.log('⚠️ PatientDetail: Setting alerts:', alertsData)
       setAlerts(alertsData)
+      // Counts come from total so they stay right even past one page
+      setAlertTotal(alertsRes.data.total ?? alertsData.length)
       
       console.log('✨ PatientDetail: All data loaded successfully')
     } catch (err: any) {
@@ -346,7 +349,7 @@ export default function PatientDetail() {
               <Grid item xs={6} sm={3}>
                 <Card variant="outlined">
                   <CardContent>
-                    <Typography variant="h4" color="error.main">{alerts.length}</Typography>
+                    <Typography variant="h4" color="error.main">{alertTotal}</Typography>
                     <Typography variant="caption">Active Alerts</Typography>
                   </CardContent>
                 </Card>
@@ -381,7 +384,7 @@ export default function PatientDetail() {
                 Document Visit (Coming Soon)
               </Button>
               <Button variant="outlined" startIcon={<AlertIcon />} fullWidth onClick={() => setTabValue(2)}>
-                View ADR Alerts ({alerts.length})
+                View ADR Alerts ({alertTotal})
               </Button>
             </Box>
           </Paper>
@@ -389,7 +392,7 @@ export default function PatientDetail() {
       </Grid>
 
       {/* Active Alerts Banner - CRITICAL SAFETY WARNING */}
-      {alerts.length > 0 && (
+      {alertTotal > 0 && (
         <Alert 
           severity="error" 
           icon={<WarningIcon />} 
@@ -406,7 +409,7 @@ export default function PatientDetail() {
               🚨 MEDICATION SAFETY ALERT - ACTION REQUIRED
             </Typography>
             <Typography variant="body1" fontWeight="medium" gutterBottom>
-              {alerts.length} active adverse drug reaction alert{alerts.length > 1 ? 's' : ''} for this patient
+              {alertTotal} active adverse drug reaction alert{alertTotal > 1 ? 's' : ''} for this patient
             </Typography>
             <Typography variant="body2" sx={{ mb: 2 }}>
               <strong>YOU MUST ACKNOWLEDGE ALL ALERTS BEFORE ADMINISTERING MEDICATIONS</strong>
@@ -561,7 +564,7 @@ export default function PatientDetail() {
       <Paper>
         <Tabs value={tabValue} onChange={(_, v) => setTabValue(v)}>
           <Tab label={`Medications (${medications.filter(m => m.is_active).length})`} icon={<MedicationIcon />} iconPosition="start" />
-          <Tab label={`ADR Alerts (${alerts.length})`} icon={<AlertIcon />} iconPosition="start" />
+          <Tab label={`ADR Alerts (${alertTotal})`} icon={<AlertIcon />} iconPosition="start" />
           <Tab label="Visits" icon={<VisitIcon />} iconPosition="start" />
         </Tabs>
 
@@ -640,6 +643,11 @@ export default function PatientDetail() {
           <Typography variant="h6" gutterBottom>
             Active ADR Alerts
           </Typography>
+          {alertTotal > alerts.length && (
+            <Typography variant="body2" color="text.secondary" gutterBottom>
+              Showing {alerts.length} of {alertTotal} alerts. Open the ADR Alerts page to see the rest.
+            </Typography>
+          )}
           {alerts.length === 0 ? (
             <Typography variant="body2" color="text.secondary" sx={{ py: 4, textAlign: 'center' }}>
               No active ADR alerts
@@ -134,8 +134,8 @@ export const vitalSignsApi = {
 // ADR Surveillance
 export const adrApi = {
   // Active alerts (reactions that have occurred)
-  getActiveAlerts: (params?: { patient_id?: number; facility_id?: number; status?: string }) =>
-    api.get<ApiResponse<ADRAlert[]>>('/adr-alerts', { params }),
+  getActiveAlerts: (params?: { patient_id?: number; facility_id?: number; status?: string; page?: number; per_page?: number }) =>
+    api.get<PaginatedResponse<ADRAlert>>('/adr-alerts', { params }),
   getAlertById: (id: number) => api.get<ApiResponse<ADRAlert>>(`/adr-alerts/${id}`),
   acknowledgeAlert: (id: number, data: any) =>
     api.post(`/adr-alerts/${id}/acknowledge`, data),
@@ -145,8 +145,9 @@ export const adrApi = {
   getPatientAlerts: (patientId: number, params?: { status?: string }) =>
     api.get<ApiResponse<ADRAlert[]>>(`/patients/${patientId}/adr-alerts`, { params }),
   // Check if user has acknowledged all alerts for patient
+  // summary: skip the alert/acknowledgment lists when administration is allowed
   checkPatientAcknowledgments: (patientId: number) =>
-    api.get(`/adr-alerts/check-patient-acknowledgments/${patientId}`),
+    api.get(`/adr-alerts/check-patient-acknowledgments/${patientId}`, { params: { summary: true } }),
   // Proactive guidance for medication pass
   getMedicationRisks: (medicationId: number) =>
     api.get<ApiResponse<any>>(`/medications/${medicationId}/adr-risks`),
@@ -21,7 +21,7 @@ import type {
 // Care Plans
 export const carePlansApi = {
   // Get all care plans with optional filtering
-  getAll: (params?: { patient_id?: number; status?: string }) =>
+  getAll: (params?: { patient_id?: number; status?: string; limit?: number; after?: string }) =>
     api.get<ApiResponse<CarePlan[]>>('/care-plans', { params }),
 
   // Get single care plan with all related items
@@ -221,12 +221,15 @@ export interface MedicationDiscrepancy {
 export interface ApiResponse<T> {
   data: T
   message?: string
+  // Set by keyset-paged lists; pass back as `after` to fetch the next page
+  next_cursor?: string | null
 }
 
 export interface PaginatedResponse<T> {
   status: string
   data: T[]
   count?: number
+  total?: number
   page?: number
   per_page?: number
   pages?: number